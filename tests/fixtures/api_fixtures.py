@@ -17,33 +17,33 @@ def flask_client(flask_app, patch_xjoin_post):
 
 @pytest.fixture(scope="function")
 def api_post(flask_client):
-    def _api_post(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
-        return do_request(flask_client.post, url, identity, host_data, query_parameters, extra_headers)
+    def _api_post(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
+        return do_request(flask_client.post, url, identity, host_data, query_parameters, extra_headers, **kwargs)
 
     return _api_post
 
 
 @pytest.fixture(scope="function")
 def api_patch(flask_client):
-    def _api_patch(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
-        return do_request(flask_client.patch, url, identity, host_data, query_parameters, extra_headers)
+    def _api_patch(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
+        return do_request(flask_client.patch, url, identity, host_data, query_parameters, extra_headers, **kwargs)
 
     return _api_patch
 
 
 @pytest.fixture(scope="function")
 def api_put(flask_client):
-    def _api_put(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
-        return do_request(flask_client.put, url, identity, host_data, query_parameters, extra_headers)
+    def _api_put(url, host_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
+        return do_request(flask_client.put, url, identity, host_data, query_parameters, extra_headers, **kwargs)
 
     return _api_put
 
 
 @pytest.fixture(scope="function")
 def api_get(flask_client):
-    def _api_get(url, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
+    def _api_get(url, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
         return do_request(
-            flask_client.get, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.get, url, identity, query_parameters=query_parameters, extra_headers=extra_headers, **kwargs
         )
 
     return _api_get
@@ -51,10 +51,15 @@ def api_get(flask_client):
 
 @pytest.fixture(scope="function")
 def api_delete_host(flask_client):
-    def _api_delete_host(host_id, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
+    def _api_delete_host(host_id, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
         url = f"{HOST_URL}/{host_id}"
         return do_request(
-            flask_client.delete, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            url,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_delete_host
@@ -62,9 +67,14 @@ def api_delete_host(flask_client):
 
 @pytest.fixture(scope="function")
 def api_delete_filtered_hosts(flask_client):
-    def _api_delete_filtered_hosts(query_parameters, identity=USER_IDENTITY, extra_headers=None):
+    def _api_delete_filtered_hosts(query_parameters, identity=USER_IDENTITY, extra_headers=None, **kwargs):
         return do_request(
-            flask_client.delete, HOST_URL, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            HOST_URL,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_delete_filtered_hosts
@@ -72,10 +82,15 @@ def api_delete_filtered_hosts(flask_client):
 
 @pytest.fixture(scope="function")
 def api_delete_all_hosts(flask_client):
-    def _api_delete_all_hosts(query_parameters, identity=USER_IDENTITY, extra_headers=None):
+    def _api_delete_all_hosts(query_parameters, identity=USER_IDENTITY, extra_headers=None, **kwargs):
         url = f"{HOST_URL}/all"
         return do_request(
-            flask_client.delete, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            url,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_delete_all_hosts
@@ -83,18 +98,25 @@ def api_delete_all_hosts(flask_client):
 
 @pytest.fixture(scope="function")
 def api_create_group(flask_client):
-    def _api_create_group(group_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
-        return do_request(flask_client.post, GROUP_URL, identity, group_data, query_parameters, extra_headers)
+    def _api_create_group(group_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
+        return do_request(
+            flask_client.post, GROUP_URL, identity, group_data, query_parameters, extra_headers, **kwargs
+        )
 
     return _api_create_group
 
 
 @pytest.fixture(scope="function")
 def api_delete_groups(flask_client):
-    def _api_delete_group(group_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
+    def _api_delete_group(group_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs):
         url = f"{GROUP_URL}/{','.join([str(group_id) for group_id in group_id_list])}"
         return do_request(
-            flask_client.delete, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            url,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_delete_group
@@ -103,11 +125,16 @@ def api_delete_groups(flask_client):
 @pytest.fixture(scope="function")
 def api_remove_hosts_from_group(flask_client):
     def _api_remove_hosts_from_group(
-        group_id, host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None
+        group_id, host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
     ):
         url = f"{GROUP_URL}/{group_id}/hosts/{','.join([str(host_id) for host_id in host_id_list])}"
         return do_request(
-            flask_client.delete, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            url,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_remove_hosts_from_group
@@ -116,7 +143,7 @@ def api_remove_hosts_from_group(flask_client):
 @pytest.fixture(scope="function")
 def api_add_hosts_to_group(flask_client):
     def _api_add_hosts_to_group(
-        group_id, host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None
+        group_id, host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
     ):
         url = f"{GROUP_URL}/{group_id}/hosts"
         return do_request(
@@ -126,6 +153,7 @@ def api_add_hosts_to_group(flask_client):
             host_id_list,
             query_parameters=query_parameters,
             extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_add_hosts_to_group
@@ -133,9 +161,11 @@ def api_add_hosts_to_group(flask_client):
 
 @pytest.fixture(scope="function")
 def api_patch_group(flask_client):
-    def _api_patch_group(group_id, group_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
+    def _api_patch_group(
+        group_id, group_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
+    ):
         url = f"{GROUP_URL}/{group_id}"
-        return do_request(flask_client.patch, url, identity, group_data, query_parameters, extra_headers)
+        return do_request(flask_client.patch, url, identity, group_data, query_parameters, extra_headers, **kwargs)
 
     return _api_patch_group
 
@@ -143,11 +173,16 @@ def api_patch_group(flask_client):
 @pytest.fixture(scope="function")
 def api_remove_hosts_from_diff_groups(flask_client):
     def _api_remove_hosts_from_diff_groups(
-        host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None
+        host_id_list, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
     ):
         url = f"{GROUP_URL}/hosts/{','.join([str(host_id) for host_id in host_id_list])}"
         return do_request(
-            flask_client.delete, url, identity, query_parameters=query_parameters, extra_headers=extra_headers
+            flask_client.delete,
+            url,
+            identity,
+            query_parameters=query_parameters,
+            extra_headers=extra_headers,
+            **kwargs,
         )
 
     return _api_remove_hosts_from_diff_groups
@@ -155,9 +190,17 @@ def api_remove_hosts_from_diff_groups(flask_client):
 
 @pytest.fixture(scope="function")
 def api_create_assign_rule(flask_client):
-    def _api_create_assign_rule(assign_rule_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
+    def _api_create_assign_rule(
+        assign_rule_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
+    ):
         return do_request(
-            flask_client.post, ASSIGNMENT_RULE_URL, identity, assign_rule_data, query_parameters, extra_headers
+            flask_client.post,
+            ASSIGNMENT_RULE_URL,
+            identity,
+            assign_rule_data,
+            query_parameters,
+            extra_headers,
+            **kwargs,
         )
 
     return _api_create_assign_rule
@@ -187,15 +230,19 @@ def user_identity_mock(flask_app):
 
 @pytest.fixture(scope="function")
 def api_create_staleness(flask_client):
-    def _api_create_staleness(staleness_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None):
-        return do_request(flask_client.post, STALENESS_URL, identity, staleness_data, query_parameters, extra_headers)
+    def _api_create_staleness(
+        staleness_data, identity=USER_IDENTITY, query_parameters=None, extra_headers=None, **kwargs
+    ):
+        return do_request(
+            flask_client.post, STALENESS_URL, identity, staleness_data, query_parameters, extra_headers, **kwargs
+        )
 
     return _api_create_staleness
 
 
 @pytest.fixture(scope="function")
 def api_delete_staleness(flask_client):
-    def _api_delete_staleness(identity=USER_IDENTITY):
-        return do_request(flask_client.delete, STALENESS_URL, identity)
+    def _api_delete_staleness(identity=USER_IDENTITY, **kwargs):
+        return do_request(flask_client.delete, STALENESS_URL, identity, **kwargs)
 
     return _api_delete_staleness
@@ -6,6 +6,7 @@ from app import db
 from app.config import Config
 from app.config import RuntimeEnvironment
 from tests.helpers.db_utils import clean_tables
+from tests.helpers.db_utils import rolled_back_session
 
 
 @pytest.fixture(scope="session")
@@ -22,10 +23,27 @@ def new_flask_app(database):
 
 
 @pytest.fixture(scope="function")
-def flask_app(new_flask_app):
-    yield new_flask_app
-
-    clean_tables()
+def flask_app(new_flask_app, request):
+    if request.node.get_closest_marker("db_commit"):
+        yield new_flask_app
+
+        clean_tables()
+    else:
+        # Tests using db_module_transaction must see its data, so their transaction is nested inside it.
+        with rolled_back_session(nested="db_module_transaction" in request.fixturenames):
+            yield new_flask_app
+
+
+@pytest.fixture(scope="module")
+def db_module_transaction(new_flask_app):
+    """
+    Data created in this transaction is visible only to the tests of the module that request it.
+    It is rolled back at the end of the module.
+    flask_app looks this fixture up by name in the requested fixtures of a test (directly or through
+    another fixture) and then nests the test's transaction inside this one instead of opening its own.
+    """
+    with rolled_back_session() as session:
+        yield session
 
 
 @pytest.fixture(scope="function")
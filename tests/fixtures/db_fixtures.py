@@ -1,6 +1,7 @@
 import os
 
 import pytest
+from sqlalchemy import create_engine
 from sqlalchemy_utils import create_database
 from sqlalchemy_utils import database_exists
 from sqlalchemy_utils import drop_database
@@ -14,11 +15,13 @@ from app.models import Host
 from app.models import HostGroupAssoc
 from app.models import Staleness
 from app.serialization import serialize_group
+from tests.helpers.db_utils import DB_FACTS
 from tests.helpers.db_utils import db_assignment_rule
 from tests.helpers.db_utils import db_group
 from tests.helpers.db_utils import db_staleness_culling
 from tests.helpers.db_utils import minimal_db_host
 from tests.helpers.db_utils import minimal_db_host_dict
+from tests.helpers.test_utils import generate_uuid
 from tests.helpers.test_utils import now
 from tests.helpers.test_utils import set_environment
 from tests.helpers.test_utils import SYSTEM_IDENTITY
@@ -34,6 +37,9 @@ def database_name():
         "INVENTORY_DB_PORT": os.getenv("INVENTORY_DB_PORT", "5432"),
     }
     db_data["INVENTORY_DB_NAME"] += "-test"
+    # Every pytest-xdist worker gets its own database
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        db_data["INVENTORY_DB_NAME"] += f"-{os.environ['PYTEST_XDIST_WORKER']}"
     with set_environment(db_data):
         yield
 
@@ -43,6 +49,11 @@ def database(database_name):
     config = Config(RuntimeEnvironment.TEST)
     if not database_exists(config.db_uri):
         create_database(config.db_uri)
+        # The data is disposable, so commits don't need to wait for the WAL to be flushed to disk.
+        engine = create_engine(config.db_uri)
+        with engine.begin() as connection:
+            connection.execute(f'ALTER DATABASE "{engine.url.database}" SET synchronous_commit TO off')
+        engine.dispose()
 
     yield config.db_uri
 
@@ -130,7 +141,7 @@ def db_create_multiple_hosts(flask_app):
     def _db_create_multiple_hosts(identity=SYSTEM_IDENTITY, hosts=None, how_many=10, extra_data=None):
         extra_data = extra_data or {}
         created_hosts = []
-        if type(hosts) == list:
+        if isinstance(hosts, list):
             for host in hosts:
                 db.session.add(host)
                 created_hosts.append(host)
@@ -157,11 +168,35 @@ def db_create_bulk_hosts(flask_app):
             hd = minimal_db_host_dict(org_id=identity["org_id"], **extra_data)
             host_dicts.append(hd)
 
-        db.engine.execute(Host.__table__.insert(), host_dicts)
+        db.session.execute(Host.__table__.insert(), host_dicts)
+        db.session.commit()
 
     return _db_create_bulk_hosts
 
 
+@pytest.fixture(scope="module")
+def db_module_three_hosts(db_module_transaction):
+    """
+    Three hosts shared by the tests of a module, created directly in the database.
+    They have the display_name and fqdn of mq_create_three_specific_hosts, but DB_FACTS and no tags.
+    """
+    created_hosts = []
+    for i in range(1, 4):
+        fqdn = "host1.DOMAIN.test" if i in (1, 2) else f"host{i}.domain.test"
+        host = minimal_db_host(
+            display_name=f"host{i}", canonical_facts={"insights_id": generate_uuid(), "fqdn": fqdn}, facts=DB_FACTS
+        )
+        db.session.add(host)
+        created_hosts.append(host)
+
+    db.session.commit()
+    # The tests run in their own sessions, reload the expired attributes while still here
+    for host in created_hosts:
+        db.session.refresh(host)
+
+    return created_hosts
+
+
 @pytest.fixture(scope="function")
 def db_create_host_in_unknown_state(db_create_host):
     host = minimal_db_host()
@@ -226,10 +261,16 @@ def db_delete_group(flask_app):
 
 
 @pytest.fixture(scope="function")
-def db_create_group_with_hosts(db_create_group, db_create_host, db_create_host_group_assoc, db_get_group_by_id):
+def db_create_group_with_hosts(
+    db_create_group, db_create_multiple_hosts, db_create_host_group_assoc, db_get_group_by_id
+):
     def _db_create_group_with_hosts(group_name, num_hosts):
         group_id = db_create_group(group_name).id
-        host_id_list = [str(db_create_host().id) for _ in range(num_hosts)]
+        hosts = [
+            minimal_db_host(org_id=SYSTEM_IDENTITY["org_id"], account=SYSTEM_IDENTITY["account_number"])
+            for _ in range(num_hosts)
+        ]
+        host_id_list = [str(host.id) for host in db_create_multiple_hosts(hosts=hosts)]
         for host_id in host_id_list:
             db_create_host_group_assoc(host_id, group_id)
 
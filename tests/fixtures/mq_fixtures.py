@@ -40,19 +40,28 @@ def mq_create_or_update_host(flask_app, event_producer_mock, notification_event_
             return event_producer_mock.key, event, event_producer.headers
 
         # add facts object since it's not returned by event message
-        return HostWrapper({**event["host"], **{"facts": host_data.facts}})
+        return HostWrapper({**event["host"], "facts": host_data.facts})
 
     return _mq_create_or_update_host
 
 
+# The static part of the mq_create_three_specific_hosts data, the insights_id is generated for every host
+THREE_SPECIFIC_HOSTS_DATA = tuple(
+    {
+        "display_name": f"host{i}",
+        "fqdn": "host1.DOMAIN.test" if i in (1, 2) else f"host{i}.domain.test",
+        "facts": FACTS,
+        "tags": TAGS[i - 1],
+    }
+    for i in range(1, 4)
+)
+
+
 @pytest.fixture(scope="function")
 def mq_create_three_specific_hosts(mq_create_or_update_host):
     created_hosts = []
-    for i in range(1, 4):
-        fqdn = "host1.DOMAIN.test" if i in (1, 2) else f"host{i}.domain.test"
-        host = minimal_host(
-            insights_id=generate_uuid(), display_name=f"host{i}", fqdn=fqdn, facts=FACTS, tags=TAGS[i - 1]
-        )
+    for host_data in THREE_SPECIFIC_HOSTS_DATA:
+        host = minimal_host(insights_id=generate_uuid(), **host_data)
         created_host = mq_create_or_update_host(host)
         created_hosts.append(created_host)
 
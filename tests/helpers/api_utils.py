@@ -1,9 +1,10 @@
 import json
 import math
 import unittest.mock as mock
-from base64 import b64encode
+from datetime import datetime
 from datetime import timedelta
 from itertools import product
+from operator import attrgetter
 from struct import unpack
 from urllib.parse import parse_qs
 from urllib.parse import quote_plus as url_quote
@@ -11,9 +12,10 @@ from urllib.parse import urlencode
 from urllib.parse import urlsplit
 from urllib.parse import urlunsplit
 
-import dateutil.parser
+import ujson
 
 from app.auth.identity import IdentityType
+from tests.helpers.test_utils import get_encoded_identity
 from tests.helpers.test_utils import now
 
 BASE_URL = "/api/inventory/v1"
@@ -23,7 +25,9 @@ GROUP_URL = f"{BASE_URL}/groups"
 TAGS_URL = f"{BASE_URL}/tags"
 SYSTEM_PROFILE_URL = f"{BASE_URL}/system_profile"
 RESOURCE_TYPES_URL = f"{BASE_URL}/resource-types"
+RESOURCE_TYPES_GROUPS_URL = f"{RESOURCE_TYPES_URL}/inventory-groups"
 STALENESS_URL = f"{BASE_URL}/account/staleness"
+STALENESS_DEFAULTS_URL = f"{STALENESS_URL}/defaults"
 
 SHARED_SECRET = "SuperSecretStuff"
 
@@ -166,22 +170,25 @@ _INPUT_DATA = {
 }
 
 
-def do_request(func, url, identity, data=None, query_parameters=None, extra_headers=None):
+def do_request(
+    func, url, identity, data=None, query_parameters=None, extra_headers=None, return_response_as_json=True
+):
     url = inject_qs(url, **query_parameters) if query_parameters else url
     headers = get_required_headers(identity)
 
-    print("Required Headers: %s", headers)
-
     if extra_headers:
         headers = {**headers, **extra_headers}
 
     if func.__name__ in ("post", "patch", "put"):
-        response = func(url, data=json.dumps(data), headers=headers)
+        response = func(url, data=ujson.dumps(data), headers=headers)
     else:
         response = func(url, headers=headers)
 
+    if not return_response_as_json:
+        return response.status_code, response.data
+
     try:
-        response_data = json.loads(response.data)
+        response_data = ujson.loads(response.data)
     except ValueError:
         response_data = {}
 
@@ -196,17 +203,11 @@ def get_valid_auth_header(identity):
 
 
 def get_required_headers(identity):
-    headers = get_valid_auth_header(identity)
-    headers["content-type"] = "application/json"
-
-    return headers
+    return {**get_valid_auth_header(identity), "content-type": "application/json"}
 
 
 def build_account_auth_header(identity):
-    dict_ = {"identity": identity}
-
-    json_doc = json.dumps(dict_)
-    auth_header = {"x-rh-identity": b64encode(json_doc.encode())}
+    auth_header = {"x-rh-identity": get_encoded_identity(identity)}
     return auth_header
 
 
@@ -227,14 +228,14 @@ def assert_host_was_updated(original_host, updated_host):
     assert updated_host["status"] == 200
     assert updated_host["host"]["id"] == original_host["host"]["id"]
     assert updated_host["host"]["updated"] is not None
-    created_time = dateutil.parser.parse(original_host["host"]["created"])
-    modified_time = dateutil.parser.parse(updated_host["host"]["updated"])
+    created_time = datetime.fromisoformat(original_host["host"]["created"])
+    modified_time = datetime.fromisoformat(updated_host["host"]["updated"])
     assert modified_time > created_time
 
 
 def assert_host_was_created(create_host_response):
     assert create_host_response["status"] == 201
-    created_time = dateutil.parser.parse(create_host_response["host"]["created"])
+    created_time = datetime.fromisoformat(create_host_response["host"]["created"])
     current_timestamp = now()
     assert current_timestamp > created_time
     assert (current_timestamp - timedelta(minutes=15)) < created_time
@@ -343,13 +344,17 @@ def api_per_page_test(api_get, subtests, url, per_page, num_pages):
 def api_pagination_invalid_parameters_test(api_get, subtests, url):
     for parameter, invalid_value in product(("per_page", "page"), ("-1", "0", "notanumber")):
         with subtests.test(parameter=parameter, invalid_value=invalid_value):
-            response_status, response_data = api_get(url, query_parameters={parameter: invalid_value})
+            response_status, _ = api_get(
+                url, query_parameters={parameter: invalid_value}, return_response_as_json=False
+            )
             assert response_status == 400
 
 
 def api_pagination_index_test(api_get, url, expected_total):
     non_existent_page = expected_total + 1
-    response_status, response_data = api_get(url, query_parameters={"page": non_existent_page, "per_page": 1})
+    response_status, _ = api_get(
+        url, query_parameters={"page": non_existent_page, "per_page": 1}, return_response_as_json=False
+    )
     assert response_status == 404
 
 
@@ -480,10 +485,10 @@ def build_facts_url(host_list_or_id, namespace, query=None):
 
 
 def build_id_list_for_url(id_or_id_list):
-    if type(id_or_id_list) == dict:
+    if isinstance(id_or_id_list, dict):
         id_or_id_list = list(id_or_id_list.values())
 
-    if type(id_or_id_list) == list:
+    if isinstance(id_or_id_list, (list, tuple)):
         # check if the list contains hosts or strings
         if not any(isinstance(item, str) for item in id_or_id_list):
             return ",".join(get_id_list_from_hosts(id_or_id_list))
@@ -510,11 +515,11 @@ def build_resource_types_url(query=None):
 
 
 def build_resource_types_groups_url(query=None):
-    return _build_url(base_url=RESOURCE_TYPES_URL + "/inventory-groups", query=query)
+    return _build_url(base_url=RESOURCE_TYPES_GROUPS_URL, query=query)
 
 
 def get_id_list_from_hosts(host_list):
-    return [str(h.id) for h in host_list]
+    return list(map(str, map(attrgetter("id"), host_list)))
 
 
 def build_staleness_url(path=None, query=None):
@@ -522,7 +527,7 @@ def build_staleness_url(path=None, query=None):
 
 
 def build_sys_default_staleness_url(path=None, query=None):
-    return _build_url(base_url=STALENESS_URL + "/defaults", path=path, query=query)
+    return _build_url(base_url=STALENESS_DEFAULTS_URL, path=path, query=query)
 
 
 def inject_qs(url, **kwargs):
@@ -1,8 +1,11 @@
 import logging
+from contextlib import contextmanager
 from datetime import timedelta
 from random import randint
 
+from sqlalchemy import event
 from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import scoped_session
 
 from app.auth.identity import Identity
 from app.models import AssignmentRule
@@ -40,6 +43,42 @@ def clean_tables():
     _clean_tables()
 
 
+@contextmanager
+def rolled_back_session(nested=False):
+    """
+    Binds db.session to a single connection inside a transaction that is rolled back on exit.
+    Commits made by the code under test only release a SAVEPOINT, which is immediately re-created.
+    If nested, the transaction is a SAVEPOINT on the connection of the enclosing rolled back session,
+    so the data created by it stays visible.
+    """
+    if nested:
+        connection = db.session.bind
+        transaction = connection.begin_nested()
+    else:
+        connection = db.engine.connect()
+        transaction = connection.begin()
+    session = db.create_session({"bind": connection, "binds": {}})()
+    # Closing would end the SAVEPOINT chain; just forget the loaded objects instead.
+    session.close = session.expunge_all
+    session.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session, session_transaction):
+        if session_transaction.nested and not session_transaction._parent.nested:
+            session.expire_all()
+            session.begin_nested()
+
+    original_session = db.session
+    db.session = scoped_session(lambda: session)
+    try:
+        yield session
+    finally:
+        db.session = original_session
+        transaction.rollback()
+        if not nested:
+            connection.close()
+
+
 def minimal_db_host(**values):
     data = minimal_db_host_dict(**values)
     return Host(**data)
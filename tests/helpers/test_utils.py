@@ -12,6 +12,8 @@ from datetime import timezone
 from random import choice
 from random import randint
 
+import ujson
+
 from app.utils import HostWrapper
 
 NS = "testns"
@@ -163,11 +165,27 @@ def valid_system_profile(owner_id=None, additional_yum_repo=None):
     return system_profile
 
 
-def get_encoded_idstr(identity=SYSTEM_IDENTITY):
-    id = {"identity": identity}
-    SYSTEM_API_KEY = base64.b64encode(json.dumps(id).encode("utf-8"))
+def _encode_identity(identity):
+    identity_doc = {"identity": identity}
+    return base64.b64encode(ujson.dumps(identity_doc).encode())
+
+
+# The shared identities are never modified in place (tests deep-copy them first),
+# so they are encoded only once. Keyed by id(), as the identities are dicts.
+_SHARED_ENCODED_IDENTITIES = {
+    id(identity): _encode_identity(identity) for identity in (USER_IDENTITY, SYSTEM_IDENTITY, SATELLITE_IDENTITY)
+}
 
-    return SYSTEM_API_KEY.decode("ascii")
+
+def get_encoded_identity(identity=SYSTEM_IDENTITY):
+    encoded_identity = _SHARED_ENCODED_IDENTITIES.get(id(identity))
+    if encoded_identity is None:
+        encoded_identity = _encode_identity(identity)
+    return encoded_identity
+
+
+def get_encoded_idstr(identity=SYSTEM_IDENTITY):
+    return get_encoded_identity(identity).decode("ascii")
 
 
 def get_platform_metadata(identity=SYSTEM_IDENTITY):
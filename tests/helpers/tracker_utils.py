@@ -48,7 +48,7 @@ def assert_payload_tracker_is_disabled(tracker, kafka_producer, null_producer, s
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, _ in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             method_to_test(status_message="expected_status_msg")
 
             # Verify that the KafkaProducer object is not called and that the NullProducer is called
@@ -75,7 +75,7 @@ def test_create_assignemnt_rule_same_name(api_create_assign_rule, db_create_grou
         },
         "enabled": True,
     }
-    response_status, _ = api_create_assign_rule(assign_rule_data)
+    response_status, _ = api_create_assign_rule(assign_rule_data, return_response_as_json=False)
     response_status, response_data = api_create_assign_rule(assign_rule_data)
     assert_response_status(response_status, expected_status=400)
     assert assign_rule_data["name"] in response_data["detail"]
@@ -97,7 +97,7 @@ def test_create_assignemnt_rule_same_group(api_create_assign_rule, db_create_gro
     assign_rule_same_group = assign_rule_data.copy()
     assign_rule_same_group["name"] = "myRule2"
 
-    response_status, _ = api_create_assign_rule(assign_rule_data)
+    response_status, _ = api_create_assign_rule(assign_rule_data, return_response_as_json=False)
     response_status, response_data = api_create_assign_rule(assign_rule_same_group)
     assert_response_status(response_status, expected_status=400)
     assert group in response_data["detail"]
@@ -124,6 +124,6 @@ def test_create_assignment_rule_RBAC_denied(subtests, mocker, api_create_assign_
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_create_assign_rule(assign_rule_data)
+            response_status, _ = api_create_assign_rule(assign_rule_data, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
@@ -200,7 +200,9 @@ def test_get_assignment_rule_id_list_RBAC_denied(subtests, mocker, api_get, enab
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
             id = str(generate_uuid())
-            response_status, _ = api_get(build_assignment_rules_url(assignment_rules_id_list=id))
+            response_status, _ = api_get(
+                build_assignment_rules_url(assignment_rules_id_list=id), return_response_as_json=False
+            )
 
             assert_response_status(response_status, 403)
 
@@ -1,11 +1,11 @@
-from base64 import b64encode
-from json import dumps
+from functools import lru_cache
 
 from app.auth.identity import Identity
 from app.auth.identity import IdentityType
 from tests.helpers.api_utils import build_token_auth_header
 from tests.helpers.api_utils import HOST_URL
 from tests.helpers.api_utils import SYSTEM_PROFILE_URL
+from tests.helpers.test_utils import get_encoded_identity
 from tests.helpers.test_utils import SYSTEM_IDENTITY
 from tests.helpers.test_utils import USER_IDENTITY
 
@@ -24,14 +24,10 @@ def invalid_identities(identity_type):
         return (no_cert_type, no_cn, no_system)
 
 
+@lru_cache(maxsize=None)
 def invalid_payloads(identity_type):
     if identity_type == IdentityType.SYSTEM:
-        payloads = ()
-        for identity in invalid_identities(IdentityType.SYSTEM):
-            dict_ = {"identity": identity}
-            json = dumps(dict_)
-            payloads += (b64encode(json.encode()),)
-        return payloads
+        return tuple(get_encoded_identity(identity) for identity in invalid_identities(IdentityType.SYSTEM))
 
 
 def valid_identity(identity_type):
@@ -45,14 +41,14 @@ def valid_identity(identity_type):
 
 
 def create_identity_payload(identity):
-    dict_ = {"identity": identity._asdict()}
-    json = dumps(dict_)
-    return b64encode(json.encode())
+    return get_encoded_identity(identity._asdict())
 
 
+@lru_cache(maxsize=None)
 def valid_payload(identity_type):
     """
     Builds a valid HTTP header payload – Base64 encoded JSON string with valid data.
+    The payload is built once per identity type and reused.
     """
     identity = valid_identity(identity_type)
     return create_identity_payload(identity)
@@ -17,53 +17,17 @@ from tests.helpers.test_utils import get_staleness_timestamps
 from tests.helpers.test_utils import SYSTEM_IDENTITY
 
 
-def test_replace_facts_to_multiple_hosts_with_branch_id(
-    db_create_multiple_hosts, db_get_hosts, api_put, event_producer_mock
-):
-    created_hosts = db_create_multiple_hosts(how_many=2, extra_data={"facts": DB_FACTS})
-
-    host_id_list = get_id_list_from_hosts(created_hosts)
-    facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE, query="?branch_id=1234")
-
-    response_status, response_data = api_put(facts_url, DB_NEW_FACTS)
-    assert_response_status(response_status, expected_status=200)
-
-    expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, DB_NEW_FACTS)
-
-    for host in db_get_hosts(host_id_list):
-        assert host.facts == expected_facts
-
-
 def test_replace_facts_to_multiple_hosts_including_nonexistent_host(db_create_multiple_hosts, db_get_hosts, api_put):
     created_hosts = db_create_multiple_hosts(how_many=2, extra_data={"facts": DB_FACTS})
 
     url_host_id_list = f"{build_id_list_for_url(created_hosts)},{generate_uuid()},{generate_uuid()}"
     facts_url = build_facts_url(host_list_or_id=url_host_id_list, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_put(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_put(facts_url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
 
-def test_replace_facts_to_multiple_hosts_with_empty_key_value_pair(
-    db_create_multiple_hosts, db_get_hosts, api_put, event_producer_mock
-):
-    new_facts = {}
-
-    created_hosts = db_create_multiple_hosts(how_many=2, extra_data={"facts": DB_FACTS})
-
-    host_id_list = get_id_list_from_hosts(created_hosts)
-    facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
-
-    # Set the value in the namespace to an empty fact set
-    response_status, response_data = api_put(facts_url, new_facts)
-    assert_response_status(response_status, expected_status=200)
-
-    expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, new_facts)
-
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
-
-
 def test_replace_facts_to_namespace_that_does_not_exist(db_create_multiple_hosts, api_patch):
     new_facts = {}
 
@@ -71,7 +35,7 @@ def test_replace_facts_to_namespace_that_does_not_exist(db_create_multiple_hosts
 
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace="imanonexistentnamespace")
 
-    response_status, response_data = api_patch(facts_url, new_facts)
+    response_status, _ = api_patch(facts_url, new_facts, return_response_as_json=False)
     assert_response_status(response_status, expected_status=400)
 
 
@@ -82,18 +46,29 @@ def test_replace_facts_without_fact_dict(api_put):
     assert_error_response(response_data, expected_status=400, expected_detail="Request body is not valid JSON")
 
 
-def test_replace_facts_on_multiple_hosts(db_create_multiple_hosts, db_get_hosts, api_put, event_producer_mock):
+@pytest.mark.parametrize(
+    "new_facts,query",
+    (
+        (DB_NEW_FACTS, None),
+        # Set the value in the namespace to an empty fact set
+        ({}, None),
+        (DB_NEW_FACTS, "?branch_id=1234"),
+    ),
+)
+def test_replace_facts_on_multiple_hosts(
+    new_facts, query, db_create_multiple_hosts, db_get_hosts, api_put, event_producer_mock
+):
     created_hosts = db_create_multiple_hosts(how_many=2, extra_data={"facts": DB_FACTS})
 
     host_id_list = get_id_list_from_hosts(created_hosts)
-    facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
+    facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE, query=query)
 
-    response_status, response_data = api_put(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_put(facts_url, new_facts, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
-    expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, DB_NEW_FACTS)
+    expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, new_facts)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
 
 def test_replace_empty_facts_on_multiple_hosts(db_create_multiple_hosts, db_get_hosts, api_put, event_producer_mock):
@@ -104,19 +79,19 @@ def test_replace_empty_facts_on_multiple_hosts(db_create_multiple_hosts, db_get_
     host_id_list = get_id_list_from_hosts(created_hosts)
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_put(facts_url, new_facts)
+    response_status, _ = api_put(facts_url, new_facts, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, new_facts)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
-    response_status, response_data = api_put(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_put(facts_url, DB_NEW_FACTS, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     expected_facts = get_expected_facts_after_update("replace", DB_FACTS_NAMESPACE, DB_FACTS, DB_NEW_FACTS)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
 
 @pytest.mark.system_culling
@@ -130,7 +105,7 @@ def test_replace_facts_on_multiple_culled_hosts(db_create_multiple_hosts, db_get
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
 
     # Try to replace the facts on a host that has been marked as culled
-    response_status, response_data = api_put(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_put(facts_url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -146,7 +121,7 @@ def test_put_facts_with_RBAC_allowed(subtests, mocker, api_put, db_create_host,
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_put(url, DB_NEW_FACTS)
+            response_status, _ = api_put(url, DB_NEW_FACTS, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -171,7 +146,7 @@ def test_put_facts_with_RBAC_allowed_specific_groups(
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_put(url, DB_NEW_FACTS)
+    response_status, _ = api_put(url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -191,7 +166,7 @@ def test_put_facts_with_RBAC_denied(
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_put(url, updated_facts)
+            response_status, _ = api_put(url, updated_facts, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -229,7 +204,7 @@ def test_put_facts_with_RBAC_denied_specific_groups(
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_put(url, updated_facts)
+    response_status, _ = api_put(url, updated_facts, return_response_as_json=False)
 
     assert_response_status(response_status, 403)
     assert db_get_host(host.id).facts[DB_FACTS_NAMESPACE] != updated_facts
@@ -243,6 +218,6 @@ def test_put_facts_with_RBAC_bypassed_as_system(api_put, db_create_host, enable_
 
     url = build_facts_url(host_list_or_id=host.id, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_put(url, DB_NEW_FACTS, SYSTEM_IDENTITY)
+    response_status, _ = api_put(url, DB_NEW_FACTS, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
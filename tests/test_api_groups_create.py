@@ -1,8 +1,8 @@
 import json
 from copy import deepcopy
+from datetime import datetime
 
 import pytest
-from dateutil import parser
 
 from tests.helpers.api_utils import assert_group_response
 from tests.helpers.api_utils import assert_response_status
@@ -64,13 +64,13 @@ def test_create_group_with_hosts(
         assert host["id"] in host_id_list
         assert host["groups"][0]["name"] == group_data["name"]
         assert host["groups"][0]["id"] == str(retrieved_group.id)
-        assert parser.isoparse(host["updated"]) == db_get_host(host["id"]).modified_on
+        assert datetime.fromisoformat(host["updated"]) == db_get_host(host["id"]).modified_on
 
 
 def test_create_group_invalid_name(api_create_group):
     group_data = {"name": "", "host_ids": []}
 
-    response_status, _ = api_create_group(group_data)
+    response_status, _ = api_create_group(group_data, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -87,7 +87,7 @@ def test_create_group_null_name(api_create_group):
 def test_create_group_taken_name(api_create_group):
     group_data = {"name": "test_group", "host_ids": []}
 
-    response_status, _ = api_create_group(group_data)
+    response_status, _ = api_create_group(group_data, return_response_as_json=False)
     response_status, response_data = api_create_group(group_data)
 
     assert_response_status(response_status, expected_status=400)
@@ -169,7 +169,7 @@ def test_create_group_RBAC_denied(subtests, mocker, api_create_group, db_get_gro
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_create_group(group_data)
+            response_status, _ = api_create_group(group_data, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -187,7 +187,7 @@ def test_create_group_RBAC_denied_attribute_filter(mocker, api_create_group, ena
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
     group_data = {"name": "my_awesome_group", "host_ids": []}
-    response_status, _ = api_create_group(group_data)
+    response_status, _ = api_create_group(group_data, return_response_as_json=False)
 
     # Access denied because of the attributeFilter
     assert_response_status(response_status, 403)
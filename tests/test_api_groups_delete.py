@@ -9,7 +9,7 @@ from tests.helpers.test_utils import generate_uuid
 def test_delete_non_existent_group(api_delete_groups, event_producer):
     group_id = generate_uuid()
 
-    response_status, response_data = api_delete_groups([group_id])
+    response_status, _ = api_delete_groups([group_id], return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=404)
 
@@ -17,7 +17,7 @@ def test_delete_non_existent_group(api_delete_groups, event_producer):
 def test_delete_with_invalid_group_id(api_delete_groups):
     group_id = "notauuid"
 
-    response_status, response_data = api_delete_groups(group_id)
+    response_status, _ = api_delete_groups(group_id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -25,7 +25,7 @@ def test_delete_with_invalid_group_id(api_delete_groups):
 def test_delete_group_ids(db_create_group, db_get_group_by_id, api_delete_groups, event_producer):
     group_id_list = [str(db_create_group(f"test_group{g_index}").id) for g_index in range(3)]
 
-    response_status, response_data = api_delete_groups(group_id_list)
+    response_status, _ = api_delete_groups(group_id_list, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=204)
 
@@ -56,7 +56,9 @@ def test_remove_hosts_from_existing_group(
     assert len(hosts_before) == 3
 
     # Remove the first two hosts from the group
-    response_status, _ = api_remove_hosts_from_group(group_id, [host for host in host_id_list[0:2]])
+    response_status, _ = api_remove_hosts_from_group(
+        group_id, [host for host in host_id_list[0:2]], return_response_as_json=False
+    )
     assert response_status == 204
 
     # Confirm that the group now only contains the last host
@@ -75,7 +77,7 @@ def test_remove_hosts_from_nonexistent_group(db_create_host, api_remove_hosts_fr
     mocker.patch.object(event_producer, "write_event")
     # Test against nonexistent group
     host_id = db_create_host().id
-    response_status, _ = api_remove_hosts_from_group(generate_uuid(), [host_id])
+    response_status, _ = api_remove_hosts_from_group(generate_uuid(), [host_id], return_response_as_json=False)
     assert response_status == 404
 
     assert event_producer.write_event.call_count == 0
@@ -98,7 +100,7 @@ def test_remove_hosts_from_someone_elses_group(
     host_id = db_create_host(diff_identity).id
     db_create_host_group_assoc(host_id, group_id)
 
-    response_status, _ = api_remove_hosts_from_group(group_id, [host_id])
+    response_status, _ = api_remove_hosts_from_group(group_id, [host_id], return_response_as_json=False)
     assert response_status == 404
 
     hosts_after = db_get_hosts_for_group(group_id)
@@ -118,7 +120,7 @@ def test_delete_groups_RBAC_denied(subtests, mocker, db_create_group, api_delete
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_delete_groups(group_id_list)
+            response_status, _ = api_delete_groups(group_id_list, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -136,7 +138,7 @@ def test_delete_groups_RBAC_allowed_specific_groups(
     mock_rbac_response[0]["resourceDefinitions"][0]["attributeFilter"]["value"] = group_id_list
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
-    response_status, _ = api_delete_groups(group_id_list)
+    response_status, _ = api_delete_groups(group_id_list, return_response_as_json=False)
 
     # Should be allowed
     assert_response_status(response_status, 204)
@@ -153,7 +155,7 @@ def test_delete_groups_RBAC_denied_specific_groups(mocker, db_create_group, api_
     mock_rbac_response[0]["resourceDefinitions"][0]["attributeFilter"]["value"] = [group_id_list[1]]
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
-    response_status, _ = api_delete_groups(group_id_list)
+    response_status, _ = api_delete_groups(group_id_list, return_response_as_json=False)
 
     # Should be denied because access is not granted to two of the groups
     assert_response_status(response_status, 403)
@@ -191,7 +193,7 @@ def test_delete_hosts_from_different_groups(
 
     # Remove one host from each group
     hosts_to_delete = [host_id_list1[0], host_id_list2[0]]
-    response_status, _ = api_remove_hosts_from_diff_groups(hosts_to_delete)
+    response_status, _ = api_remove_hosts_from_diff_groups(hosts_to_delete, return_response_as_json=False)
     assert_response_status(response_status, 204)
 
     # Confirm that the groups now only contain the last host
@@ -252,7 +254,7 @@ def test_delete_hosts_from_different_groups_RBAC_denied(
     # Try to remove one host from each group
     hosts_to_delete = [host_id_list1[0], host_id_list2[0]]
 
-    response_status, _ = api_remove_hosts_from_diff_groups(hosts_to_delete)
+    response_status, _ = api_remove_hosts_from_diff_groups(hosts_to_delete, return_response_as_json=False)
     assert_response_status(response_status, 403)
 
     # Check that the hosts weren't deleted
@@ -286,7 +288,7 @@ def test_delete_hosts_no_group(
     hosts_before = db_get_hosts_for_group(group_id)
     assert len(hosts_before) == 1
 
-    response_status, _ = api_remove_hosts_from_diff_groups(host_id_list)
+    response_status, _ = api_remove_hosts_from_diff_groups(host_id_list, return_response_as_json=False)
     assert_response_status(response_status, 204)
 
     # Confirm that the host was removed from the group
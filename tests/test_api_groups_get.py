@@ -29,7 +29,7 @@ def test_get_groups_RBAC_denied(subtests, mocker, api_get, enable_rbac):
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_get(build_groups_url())
+            response_status, _ = api_get(build_groups_url(), return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -1,8 +1,8 @@
 import json
 from copy import deepcopy
+from datetime import datetime
 
 import pytest
-from dateutil import parser
 
 from tests.helpers.api_utils import assert_group_response
 from tests.helpers.api_utils import assert_response_status
@@ -40,7 +40,7 @@ def test_patch_group_happy_path(
     if patch_name:
         patch_doc["name"] = "modified_group"
 
-    response_status, response_data = api_patch_group(group_id, patch_doc)
+    response_status, _ = api_patch_group(group_id, patch_doc, return_response_as_json=False)
     assert_response_status(response_status, 200)
     retrieved_group = db_get_group_by_id(group_id)
 
@@ -78,7 +78,7 @@ def test_patch_group_happy_path(
     assert retrieved_group.modified_on > orig_modified_on
 
     # Confirm that the updated date on the json data matches the date in the DB
-    assert parser.isoparse(response_data["updated"]) == retrieved_group.modified_on
+    assert datetime.fromisoformat(response_data["updated"]) == retrieved_group.modified_on
 
     # Validate the event_producer's messages
     # Call count should be the num_hosts +1 since the first message is the existing host being removed
@@ -106,7 +106,7 @@ def test_patch_group_wrong_org_id_for_group(
 
     patch_doc = {"name": "modified_group", "host_ids": host_id_list}
 
-    response_status, response_data = api_patch_group(group.id, patch_doc, diff_identity)
+    response_status, _ = api_patch_group(group.id, patch_doc, diff_identity, return_response_as_json=False)
 
     # It can't find a group with that ID within the user's org, so it should return 404
     assert_response_status(response_status, 404)
@@ -128,7 +128,7 @@ def test_patch_group_existing_name_different_org(
 
     patch_doc = {"name": "modified_group", "host_ids": host_id_list}
 
-    response_status, response_data = api_patch_group(group.id, patch_doc, diff_identity)
+    response_status, _ = api_patch_group(group.id, patch_doc, diff_identity, return_response_as_json=False)
 
     # It can't find a group with that ID within the user's org, so it should return 404
     assert_response_status(response_status, 404)
@@ -187,7 +187,7 @@ def test_patch_groups_RBAC_allowed_specific_groups(
     get_rbac_permissions_mock.return_value = mock_rbac_response
     patch_doc = {"name": "new_name"}
 
-    response_status, _ = api_patch_group(group_id, patch_doc)
+    response_status, _ = api_patch_group(group_id, patch_doc, return_response_as_json=False)
 
     # Should be allowed
     assert_response_status(response_status, 200)
@@ -205,7 +205,7 @@ def test_patch_groups_RBAC_denied_specific_groups(mocker, db_create_group_with_h
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
     patch_doc = {"name": "new_name"}
-    response_status, _ = api_patch_group(group_id, patch_doc)
+    response_status, _ = api_patch_group(group_id, patch_doc, return_response_as_json=False)
 
     # Access was not granted
     assert_response_status(response_status, 403)
@@ -216,7 +216,7 @@ def test_patch_group_no_name(db_create_group_with_hosts, api_patch_group, db_get
     group = db_create_group_with_hosts("test_group", 2)
     patch_doc = {"name": ""}
 
-    response_status, _ = api_patch_group(group.id, patch_doc)
+    response_status, _ = api_patch_group(group.id, patch_doc, return_response_as_json=False)
 
     # The group name isn't allowed to be empty, so return 400
     assert_response_status(response_status, 400)
@@ -301,7 +301,7 @@ def test_patch_group_name_only(
     assert retrieved_group.modified_on > orig_modified_on
 
     # Confirm that the updated date on the json data matches the date in the DB
-    assert parser.isoparse(response_data["updated"]) == retrieved_group.modified_on
+    assert datetime.fromisoformat(response_data["updated"]) == retrieved_group.modified_on
 
     # Validate the event_producer's message
     assert event_producer.write_event.call_count == 1
@@ -321,7 +321,7 @@ def test_patch_group_same_hosts(
     host_id_list = [str(host.id) for host in group.hosts]
 
     patch_doc = {"name": "modified_group", "host_ids": host_id_list}
-    response_status, _ = api_patch_group(group_id, patch_doc)
+    response_status, _ = api_patch_group(group_id, patch_doc, return_response_as_json=False)
     assert_response_status(response_status, 200)
 
     # Validate that we only sent 1 message per host
@@ -345,7 +345,7 @@ def test_patch_group_both_add_and_remove_hosts(
     new_host_id_list = [original_host_id_list[0], str(db_create_host().id), str(db_create_host().id)]
 
     patch_doc = {"name": "modified_group", "host_ids": new_host_id_list}
-    response_status, _ = api_patch_group(group_id, patch_doc)
+    response_status, _ = api_patch_group(group_id, patch_doc, return_response_as_json=False)
     assert_response_status(response_status, 200)
 
     # We should have sent 5 messages:
@@ -1,6 +1,5 @@
 import uuid
-
-from dateutil.parser import parse
+from datetime import datetime
 
 from tests.helpers.api_utils import assert_response_status
 from tests.helpers.api_utils import create_mock_rbac_response
@@ -15,7 +14,9 @@ def test_add_host_to_group(
     group_id = db_create_group("test_group").id
     host_id_list = [db_create_host().id for _ in range(3)]
 
-    response_status, _ = api_add_hosts_to_group(group_id, [str(host) for host in host_id_list[0:2]])
+    response_status, _ = api_add_hosts_to_group(
+        group_id, [str(host) for host in host_id_list[0:2]], return_response_as_json=False
+    )
     assert response_status == 200
 
     # Confirm that the group now only contains  2 hosts
@@ -37,7 +38,9 @@ def test_add_host_to_group_RBAC_denied(
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
             host_id_list = [db_create_host().id for _ in range(3)]
-            response_status, _ = api_add_hosts_to_group(group_id, [str(host) for host in host_id_list[0:2]])
+            response_status, _ = api_add_hosts_to_group(
+                group_id, [str(host) for host in host_id_list[0:2]], return_response_as_json=False
+            )
 
             assert_response_status(response_status, 403)
 
@@ -67,7 +70,9 @@ def test_add_host_to_group_RBAC_allowed_specific_groups(
 
     host_id_list = [db_create_host().id for _ in range(3)]
 
-    response_status, _ = api_add_hosts_to_group(group_id, [str(host) for host in host_id_list[0:2]])
+    response_status, _ = api_add_hosts_to_group(
+        group_id, [str(host) for host in host_id_list[0:2]], return_response_as_json=False
+    )
 
     # Should be allowed
     assert_response_status(response_status, 200)
@@ -91,7 +96,9 @@ def test_add_host_to_group_RBAC_denied_specific_groups(
 
     host_id_list = [db_create_host().id for _ in range(3)]
 
-    response_status, _ = api_add_hosts_to_group(group_id, [str(host) for host in host_id_list[0:2]])
+    response_status, _ = api_add_hosts_to_group(
+        group_id, [str(host) for host in host_id_list[0:2]], return_response_as_json=False
+    )
 
     # Access was not granted
     assert_response_status(response_status, 403)
@@ -133,7 +140,7 @@ def test_add_associated_host_to_same_group(
     # Make sure that the events were produced
     assert event_producer.write_event.call_count == 3
 
-    second_update = parse(updated_group["updated"])
+    second_update = datetime.fromisoformat(updated_group["updated"])
     assert second_update > first_update
 
 
@@ -164,7 +171,7 @@ def test_add_associated_host_to_different_group(
     assert len(hosts_before) == 1
 
     # Confirm that the API does not allow these hosts to be added to the group
-    response_status, _ = api_add_hosts_to_group(group1_id, host_id_list)
+    response_status, _ = api_add_hosts_to_group(group1_id, host_id_list, return_response_as_json=False)
     assert response_status == 400
 
     # Make sure that everything was rolled back and no events were produced
@@ -189,7 +196,9 @@ def test_add_host_list_with_one_associated_host_to_group(
     db_create_host_group_assoc(host_id_list[2], group_id)
 
     # adding only id[1], since 0 and 2 already associated above
-    response_status, _ = api_add_hosts_to_group(group_id, [str(host) for host in host_id_list])
+    response_status, _ = api_add_hosts_to_group(
+        group_id, [str(host) for host in host_id_list], return_response_as_json=False
+    )
     assert response_status == 200
 
     # Confirm that the group now only contains  2 hosts
@@ -202,7 +211,9 @@ def test_add_host_to_missing_group(db_create_host, api_add_hosts_to_group, event
     missing_group_id = "454dddba-9a4d-42b3-8f16-86a8c1400000"
     host_id_list = [db_create_host().id for _ in range(3)]
 
-    response_status, _ = api_add_hosts_to_group(missing_group_id, [str(host) for host in host_id_list])
+    response_status, _ = api_add_hosts_to_group(
+        missing_group_id, [str(host) for host in host_id_list], return_response_as_json=False
+    )
     assert response_status == 404
 
 
@@ -210,24 +221,24 @@ def test_add_missing_host_to_existing_group(db_create_group, api_add_hosts_to_gr
     group_id = db_create_group("test_group").id
     host_id_list = [str(uuid.uuid4())]
 
-    response_status, _ = api_add_hosts_to_group(group_id, host_id_list)
+    response_status, _ = api_add_hosts_to_group(group_id, host_id_list, return_response_as_json=False)
     assert response_status == 400
 
 
 def test_with_empty_data(api_add_hosts_to_group, event_producer):
-    response_status, _ = api_add_hosts_to_group(None, None)
+    response_status, _ = api_add_hosts_to_group(None, None, return_response_as_json=False)
     assert response_status == 400
 
 
 def test_add_empty_body_to_group(db_create_group, api_add_hosts_to_group):
     group_id = db_create_group("test_group").id
-    response_status, _ = api_add_hosts_to_group(group_id, None)
+    response_status, _ = api_add_hosts_to_group(group_id, None, return_response_as_json=False)
 
     assert response_status == 400
 
 
 def test_add_empty_array_to_group(db_create_group, api_add_hosts_to_group):
     group_id = db_create_group("test_group").id
-    response_status, _ = api_add_hosts_to_group(group_id, [])
+    response_status, _ = api_add_hosts_to_group(group_id, [], return_response_as_json=False)
 
     assert response_status == 400
@@ -23,7 +23,7 @@ from tests.helpers.test_utils import SYSTEM_IDENTITY
 def test_delete_non_existent_host(event_producer_mock, api_delete_host):
     host_id = generate_uuid()
 
-    response_status, response_data = api_delete_host(host_id)
+    response_status, _ = api_delete_host(host_id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=404)
 
@@ -31,7 +31,7 @@ def test_delete_non_existent_host(event_producer_mock, api_delete_host):
 def test_delete_with_invalid_host_id(api_delete_host):
     host_id = "notauuid"
 
-    response_status, response_data = api_delete_host(host_id)
+    response_status, _ = api_delete_host(host_id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -39,7 +39,7 @@ def test_delete_with_invalid_host_id(api_delete_host):
 def test_create_then_delete(event_datetime_mock, event_producer_mock, db_create_host, db_get_host, api_delete_host):
     host = db_create_host()
 
-    response_status, response_data = api_delete_host(host.id)
+    response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -53,7 +53,9 @@ def test_create_then_delete_with_branch_id(
 ):
     host = db_create_host()
 
-    response_status, response_data = api_delete_host(host.id, query_parameters={"branch_id": "1234"})
+    response_status, _ = api_delete_host(
+        host.id, query_parameters={"branch_id": "1234"}, return_response_as_json=False
+    )
 
     assert_response_status(response_status, expected_status=200)
 
@@ -68,7 +70,7 @@ def test_create_then_delete_with_request_id(event_datetime_mock, event_producer_
     request_id = generate_uuid()
     headers = {"x-rh-insights-request-id": request_id}
 
-    response_status, response_data = api_delete_host(host.id, extra_headers=headers)
+    response_status, _ = api_delete_host(host.id, extra_headers=headers, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -82,7 +84,7 @@ def test_create_then_delete_without_request_id(
 ):
     host = db_create_host()
 
-    response_status, response_data = api_delete_host(host.id)
+    response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -102,7 +104,7 @@ def test_create_then_delete_without_insights_id(
 
     db_create_host(host=host)
 
-    response_status, response_data = api_delete_host(host.id)
+    response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -195,7 +197,7 @@ def test_delete_over_100_filtered_hosts(
     patched_delete = mocker.patch("api.host._delete_host_list")
 
     # delete hosts using the IDs supposedly returned by the query_filter
-    response_status, response_data = api_delete_filtered_hosts({"staleness": "stale"})
+    response_status, _ = api_delete_filtered_hosts({"staleness": "stale"}, return_response_as_json=False)
 
     # Just double-check that it didn't error out
     assert_response_status(response_status, expected_status=202)
@@ -239,7 +241,7 @@ def test_delete_all_hosts(
 
 def test_delete_all_hosts_with_missing_required_params(api_delete_all_hosts, event_producer_mock):
     # delete all hosts using incomplete filter
-    response_status, response_data = api_delete_all_hosts({})
+    response_status, _ = api_delete_all_hosts({}, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
     assert event_producer_mock.event is None
@@ -253,7 +255,7 @@ def test_create_then_delete_check_metadata(event_datetime_mock, event_producer_m
     request_id = generate_uuid()
     headers = {"x-rh-insights-request-id": request_id}
 
-    response_status, response_data = api_delete_host(host.id, extra_headers=headers)
+    response_status, _ = api_delete_host(host.id, extra_headers=headers, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -275,7 +277,7 @@ def test_delete_when_one_host_is_deleted(event_producer_mock, db_create_host, ap
 
     # One host queried, but deleted by a different process. No event emitted yet returning
     # 200 OK.
-    response_status, response_data = api_delete_host(host.id)
+    response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=404)
 
@@ -290,7 +292,7 @@ def test_delete_when_all_hosts_are_deleted(event_producer_mock, db_create_multip
 
     # Two hosts queried, but both deleted by a different process. No event emitted yet
     # returning 200 OK.
-    response_status, response_data = api_delete_host(",".join(host_id_list))
+    response_status, _ = api_delete_host(",".join(host_id_list), return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=404)
 
@@ -305,7 +307,7 @@ def test_delete_when_some_hosts_is_deleted(event_producer_mock, db_create_multip
 
     # Two hosts queried, one of them deleted by a different process. Only one event emitted,
     # returning 200 OK.
-    response_status, response_data = api_delete_host(",".join(host_id_list))
+    response_status, _ = api_delete_host(",".join(host_id_list), return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -331,7 +333,7 @@ def test_delete_host_with_RBAC_allowed(
 
             host = db_create_host()
 
-            response_status, response_data = api_delete_host(host.id)
+            response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -352,7 +354,7 @@ def test_delete_host_with_RBAC_denied(
 
             host = db_create_host()
 
-            response_status, response_data = api_delete_host(host.id)
+            response_status, _ = api_delete_host(host.id, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -366,7 +368,7 @@ def test_delete_host_with_RBAC_bypassed_as_system(
         SYSTEM_IDENTITY, extra_data={"system_profile_facts": {"owner_id": SYSTEM_IDENTITY["system"]["cn"]}}
     )
 
-    response_status, response_data = api_delete_host(host.id, SYSTEM_IDENTITY)
+    response_status, _ = api_delete_host(host.id, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -386,7 +388,7 @@ def test_delete_hosts_chunk_size(
     hosts = db_create_multiple_hosts(how_many=2)
     host_id_list = [str(host.id) for host in hosts]
 
-    response_status, response_data = api_delete_host(",".join(host_id_list))
+    response_status, _ = api_delete_host(",".join(host_id_list), return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -403,7 +405,7 @@ def test_delete_stops_after_kafka_exception(
 
     event_producer._kafka_producer.produce.side_effect = send_side_effects
 
-    response_status, response_data = api_delete_host(",".join(host_id_list))
+    response_status, _ = api_delete_host(",".join(host_id_list), return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=500)
 
@@ -429,7 +431,7 @@ def test_delete_with_callback_receiving_error(
     msgdet = MessageDetails(topic=None, event=message, headers=headers, key=host.id)
     event_producer._kafka_producer.produce.side_effects = msgdet.on_delivered(error, message)
 
-    response_status, response_data = api_delete_host(",".join([str(host.id)]))
+    response_status, _ = api_delete_host(",".join([str(host.id)]), return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -464,7 +466,7 @@ def test_delete_host_that_belongs_to_group_success(
     assert len(hosts_before) == 3
 
     # Delete the first host
-    response_status, _ = api_delete_host(host_id_list[0])
+    response_status, _ = api_delete_host(host_id_list[0], return_response_as_json=False)
     assert response_status == 200
 
     # Confirm that the group does not contain the first host
@@ -535,7 +537,7 @@ def test_delete_host_RBAC_allowed_specific_groups(
     mock_rbac_response[0]["resourceDefinitions"][0]["attributeFilter"]["value"] = group_id_list
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_delete_host(host_id)
+    response_status, _ = api_delete_host(host_id, return_response_as_json=False)
 
     # Should be allowed
     assert_response_status(response_status, 200)
@@ -556,7 +558,7 @@ def test_delete_host_RBAC_denied_specific_groups(
     mock_rbac_response[0]["resourceDefinitions"][0]["attributeFilter"]["value"] = [generate_uuid(), generate_uuid()]
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_delete_host(host_id)
+    response_status, _ = api_delete_host(host_id, return_response_as_json=False)
 
     # If the user doesn't have access to the group, the host can't be found. Should this be 404 or 403?
     assert_response_status(response_status, expected_status=404)
@@ -32,8 +32,8 @@ def test_query_single_non_existent_host(api_get, subtests):
     api_query_test(api_get, subtests, url, [])
 
 
-def test_query_invalid_host_id(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_query_invalid_host_id(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
     bad_id_list = ["notauuid", "1234blahblahinvalid"]
     only_bad_id = bad_id_list.copy()
 
@@ -45,7 +45,7 @@ def test_query_invalid_host_id(mq_create_three_specific_hosts, api_get, subtests
     for host_id_list in chain(only_bad_id, with_bad_id):
         with subtests.test(host_id_list=host_id_list):
             url = build_hosts_url(host_list_or_id=host_id_list)
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
             assert response_status == 400
 
 
@@ -57,31 +57,31 @@ def test_query_host_id_with_incorrect_formats(api_get, subtests):
     for bad_host_id in bad_host_ids:
         with subtests.test():
             url = build_hosts_url(host_list_or_id=bad_host_id)
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
             assert response_status == 400
 
 
-def test_query_invalid_paging_parameters(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_query_invalid_paging_parameters(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
     url = build_hosts_url(host_list_or_id=created_hosts)
 
     api_pagination_invalid_parameters_test(api_get, subtests, url)
 
 
-def test_query_with_invalid_insights_id(mq_create_three_specific_hosts, api_get, subtests):
+def test_query_with_invalid_insights_id(api_get, subtests):
     url = build_hosts_url(query="?insights_id=notauuid")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
 
-def test_get_host_with_invalid_tag_no_key(mq_create_three_specific_hosts, api_get):
+def test_get_host_with_invalid_tag_no_key(api_get):
     """
     Attempt to find host with an incomplete tag (no key).
     Expects 400 response.
     """
     url = build_hosts_url(query="?tags=namespace/=Value")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -94,7 +94,7 @@ def test_get_host_with_invalid_tag_no_key(mq_create_three_specific_hosts, api_ge
         (f"namespace/key={'a' * 256}", "value"),
     ),
 )
-def test_get_host_tag_part_too_long(tag_query, part_name, mq_create_three_specific_hosts, api_get):
+def test_get_host_tag_part_too_long(tag_query, part_name, api_get):
     """
     send a request to find hosts with a string tag where the length
     of the namespace excedes the 255 character limit
@@ -108,8 +108,8 @@ def test_get_host_tag_part_too_long(tag_query, part_name, mq_create_three_specif
     )
 
 
-def test_invalid_order_by(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_invalid_order_by(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
 
     urls = (
         HOST_URL,
@@ -119,12 +119,12 @@ def test_invalid_order_by(mq_create_three_specific_hosts, api_get, subtests):
     for url in urls:
         with subtests.test(url=url):
             order_query_parameters = build_order_query_parameters(order_by="fqdn", order_how="ASC")
-            response_status, response_data = api_get(url, query_parameters=order_query_parameters)
+            response_status, _ = api_get(url, query_parameters=order_query_parameters, return_response_as_json=False)
             assert response_status == 400
 
 
-def test_invalid_order_how(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_invalid_order_how(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
 
     urls = (
         HOST_URL,
@@ -134,12 +134,12 @@ def test_invalid_order_how(mq_create_three_specific_hosts, api_get, subtests):
     for url in urls:
         with subtests.test(url=url):
             order_query_parameters = build_order_query_parameters(order_by="display_name", order_how="asc")
-            response_status, response_data = api_get(url, query_parameters=order_query_parameters)
+            response_status, _ = api_get(url, query_parameters=order_query_parameters, return_response_as_json=False)
             assert response_status == 400
 
 
-def test_only_order_how(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_only_order_how(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
 
     urls = (
         HOST_URL,
@@ -149,12 +149,12 @@ def test_only_order_how(mq_create_three_specific_hosts, api_get, subtests):
     for url in urls:
         with subtests.test(url=url):
             order_query_parameters = build_order_query_parameters(order_by=None, order_how="ASC")
-            response_status, response_data = api_get(url, query_parameters=order_query_parameters)
+            response_status, _ = api_get(url, query_parameters=order_query_parameters, return_response_as_json=False)
             assert response_status == 400
 
 
-def test_invalid_fields(mq_create_three_specific_hosts, api_get, subtests):
-    created_hosts = mq_create_three_specific_hosts
+def test_invalid_fields(db_module_three_hosts, api_get, subtests):
+    created_hosts = db_module_three_hosts
 
     urls = (
         HOST_URL,
@@ -164,7 +164,7 @@ def test_invalid_fields(mq_create_three_specific_hosts, api_get, subtests):
     for url in urls:
         with subtests.test(url=url):
             fields_query_parameters = build_fields_query_parameters(fields="i_love_ketchup")
-            response_status, response_data = api_get(url, query_parameters=fields_query_parameters)
+            response_status, _ = api_get(url, query_parameters=fields_query_parameters, return_response_as_json=False)
             assert response_status == 400
 
 
@@ -174,7 +174,7 @@ def test_invalid_fields(mq_create_three_specific_hosts, api_get, subtests):
 )
 def test_get_hosts_registered_with(api_get, value):
     url = build_hosts_url(query=f"?registered_with={value}")
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -200,7 +200,7 @@ def test_get_hosts_with_RBAC_allowed(subtests, mocker, db_create_host, api_get,
             host = db_create_host()
 
             url = build_hosts_url(host_list_or_id=host.id)
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -219,7 +219,7 @@ def test_get_hosts_with_RBAC_denied(subtests, mocker, db_create_host, api_get, e
             host = db_create_host()
 
             url = build_hosts_url(host_list_or_id=host.id)
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -230,7 +230,7 @@ def test_get_hosts_with_RBAC_bypassed_as_system(db_create_host, api_get, enable_
     host = db_create_host(SYSTEM_IDENTITY, extra_data={"system_profile_facts": {"owner_id": generate_uuid()}})
 
     url = build_hosts_url(host_list_or_id=host.id)
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -281,8 +281,8 @@ def test_get_hosts_sap_system_bad_parameter_values(patch_xjoin_post, api_get, su
             implicit_url = build_hosts_url(query=f"?filter[system_profile][sap_system]={value}")
             eq_url = build_hosts_url(query=f"?filter[system_profile][sap_system][eq]={value}")
 
-            implicit_response_status, implicit_response_data = api_get(implicit_url)
-            eq_response_status, eq_response_data = api_get(eq_url)
+            implicit_response_status, _ = api_get(implicit_url, return_response_as_json=False)
+            eq_response_status, _ = api_get(eq_url, return_response_as_json=False)
 
             assert_response_status(implicit_response_status, 400)
             assert_response_status(eq_response_status, 400)
@@ -300,8 +300,8 @@ def test_get_hosts_unsupported_filter(mocker, patch_xjoin_post, api_get, hide_ed
     implicit_url = build_hosts_url(query="?filter[system_profile][bad_thing]=Banana")
     eq_url = build_hosts_url(query="?filter[Bad_thing][Extra_bad_one][eq]=Pinapple")
 
-    implicit_response_status, _ = api_get(implicit_url)
-    eq_response_status, _ = api_get(eq_url)
+    implicit_response_status, _ = api_get(implicit_url, return_response_as_json=False)
+    eq_response_status, _ = api_get(eq_url, return_response_as_json=False)
 
     assert_response_status(implicit_response_status, 400)
     assert_response_status(eq_response_status, 400)
@@ -318,7 +318,7 @@ def test_get_hosts_unsupported_filter(mocker, patch_xjoin_post, api_get, hide_ed
 def test_get_hosts_invalid_deep_object_params(query_params, api_get):
     invalid_url = build_hosts_url(query=query_params)
 
-    response_code, _ = api_get(invalid_url)
+    response_code, _ = api_get(invalid_url, return_response_as_json=False)
     assert_response_status(response_code, 400)
 
 
@@ -400,7 +400,7 @@ def test_validate_sp_sparse_fields_invalid_requests(api_get):
         host_one_id, host_two_id = generate_uuid(), generate_uuid()
         hosts = [minimal_host(id=host_one_id), minimal_host(id=host_two_id)]
 
-        response_status, response_data = api_get(build_system_profile_url(hosts, query=query))
+        response_status, _ = api_get(build_system_profile_url(hosts, query=query), return_response_as_json=False)
         assert response_status == 400
 
 
@@ -437,7 +437,7 @@ def test_unindexed_fields_fail_gracefully(api_get):
 
     for url_builder in url_builders:
         for query in ("?filter[system_profile][installed_packages_delta]=foo",):
-            response_status, _ = api_get(url_builder(query=query))
+            response_status, _ = api_get(url_builder(query=query), return_response_as_json=False)
             assert response_status == 400
 
 
@@ -457,9 +457,9 @@ def test_get_hosts_contains_works_on_string_array(patch_xjoin_post, api_get, sub
     )
     query = "?filter[system_profile][cpu_flags][contains]=ex1"
     for url_builder, response in zip(url_builders, responses):
-        with subtests.test(url_builder=url_builder, response=response, query=query):
+        with subtests.test(url_builder=url_builder.__name__, response=response, query=query):
             patch_xjoin_post(response={"data": response})
-            response_status, _ = api_get(url_builder(query=query))
+            response_status, _ = api_get(url_builder(query=query), return_response_as_json=False)
             assert response_status == 200
 
 
@@ -473,8 +473,8 @@ def test_get_hosts_contains_invalid_on_string_not_array(patch_xjoin_post, api_ge
     )
     query = "?filter[system_profile][cpu_model][contains]=Intel(R) I7(R) CPU I7-10900k 0 @ 4.90GHz"
     for url_builder in url_builders:
-        with subtests.test(url_builder=url_builder, query=query):
-            response_status, _ = api_get(url_builder(query=query))
+        with subtests.test(url_builder=url_builder.__name__, query=query):
+            response_status, _ = api_get(url_builder(query=query), return_response_as_json=False)
             assert response_status == 400
 
 
@@ -42,7 +42,7 @@ def test_update_fields(patch_doc, event_producer_mock, db_create_host, db_get_ho
     host2 = db_create_host()
 
     url = build_hosts_url(host_list_or_id=[host, host2])
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -65,8 +65,11 @@ def test_checkin_canonical_facts(
     post_doc = created_host.canonical_facts
     updated_time = created_host.modified_on
 
-    response_status, response_data = api_post(
-        build_host_checkin_url(), post_doc, extra_headers={"x-rh-insights-request-id": "123456"}
+    response_status, _ = api_post(
+        build_host_checkin_url(),
+        post_doc,
+        extra_headers={"x-rh-insights-request-id": "123456"},
+        return_response_as_json=False,
     )
 
     assert_response_status(response_status, expected_status=201)
@@ -90,8 +93,11 @@ def test_checkin_checkin_frequency_valid(event_producer_mock, db_create_host, ap
     )
 
     post_doc = {**created_host.canonical_facts, "checkin_frequency": 720}
-    response_status, response_data = api_post(
-        build_host_checkin_url(), post_doc, extra_headers={"x-rh-insights-request-id": "123456"}
+    response_status, _ = api_post(
+        build_host_checkin_url(),
+        post_doc,
+        extra_headers={"x-rh-insights-request-id": "123456"},
+        return_response_as_json=False,
     )
 
     assert_response_status(response_status, expected_status=201)
@@ -104,8 +110,11 @@ def test_checkin_checkin_frequency_invalid(event_producer_mock, db_create_host,
     created_host = db_create_host(extra_data={"canonical_facts": canonical_facts})
 
     post_doc = {**created_host.canonical_facts, "checkin_frequency": checkin_frequency}
-    response_status, response_data = api_post(
-        build_host_checkin_url(), post_doc, extra_headers={"x-rh-insights-request-id": "123456"}
+    response_status, _ = api_post(
+        build_host_checkin_url(),
+        post_doc,
+        extra_headers={"x-rh-insights-request-id": "123456"},
+        return_response_as_json=False,
     )
 
     assert_response_status(response_status, expected_status=400)
@@ -114,8 +123,11 @@ def test_checkin_checkin_frequency_invalid(event_producer_mock, db_create_host,
 def test_checkin_no_matching_host(event_producer_mock, db_create_host, db_get_host, api_post):
     post_doc = {"insights_id": generate_uuid()}
 
-    response_status, response_data = api_post(
-        build_host_checkin_url(), post_doc, extra_headers={"x-rh-insights-request-id": "123456"}
+    response_status, _ = api_post(
+        build_host_checkin_url(),
+        post_doc,
+        extra_headers={"x-rh-insights-request-id": "123456"},
+        return_response_as_json=False,
     )
 
     assert_response_status(response_status, expected_status=404)
@@ -125,8 +137,11 @@ def test_checkin_no_matching_host(event_producer_mock, db_create_host, db_get_ho
 
 @pytest.mark.parametrize(("post_doc",), (({},), ({"checkin_frequency": "720"},)))
 def test_checkin_no_canonical_facts(event_producer_mock, db_create_host, db_get_host, api_post, post_doc):
-    response_status, response_data = api_post(
-        build_host_checkin_url(), post_doc, extra_headers={"x-rh-insights-request-id": "123456"}
+    response_status, _ = api_post(
+        build_host_checkin_url(),
+        post_doc,
+        extra_headers={"x-rh-insights-request-id": "123456"},
+        return_response_as_json=False,
     )
 
     assert_response_status(response_status, expected_status=400)
@@ -140,7 +155,7 @@ def test_patch_with_branch_id_parameter(event_producer_mock, db_create_multiple_
     hosts = db_create_multiple_hosts(how_many=5)
 
     url = build_hosts_url(host_list_or_id=hosts, query="?branch_id=123")
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -151,7 +166,7 @@ def test_update_fields_on_multiple_hosts(event_producer_mock, db_create_multiple
     hosts = db_create_multiple_hosts(how_many=5)
 
     url = build_hosts_url(host_list_or_id=hosts)
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -169,7 +184,7 @@ def test_patch_on_non_existent_host(api_patch):
     patch_doc = {"ansible_host": "NEW_ansible_host"}
 
     url = build_hosts_url(host_list_or_id=non_existent_id)
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=404)
 
@@ -181,7 +196,7 @@ def test_patch_on_multiple_hosts_with_some_non_existent(event_producer_mock, db_
     patch_doc = {"ansible_host": "NEW_ansible_host"}
 
     url = build_hosts_url(host_list_or_id=f"{non_existent_id},{host.id}")
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
@@ -194,7 +209,7 @@ def test_invalid_data(invalid_data, db_create_host, api_patch):
     host = db_create_host()
 
     url = build_hosts_url(host_list_or_id=host.id)
-    response_status, response_data = api_patch(url, invalid_data)
+    response_status, _ = api_patch(url, invalid_data, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -208,7 +223,7 @@ def test_invalid_host_id(db_create_host, api_patch, subtests):
     for host_id_list in host_id_lists:
         with subtests.test(host_id_list=host_id_list):
             url = build_hosts_url(host_list_or_id=host_id_list)
-            response_status, response_data = api_patch(url, patch_doc)
+            response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
             assert_response_status(response_status, expected_status=400)
 
 
@@ -221,7 +236,7 @@ def test_patch_produces_update_event_no_request_id(
     patch_doc = {"display_name": "patch_event_test"}
 
     url = build_hosts_url(host_list_or_id=created_host.id)
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     assert_patch_event_is_valid(
@@ -243,7 +258,7 @@ def test_patch_produces_update_event_with_request_id(
     created_host = db_create_host(host=host)
 
     url = build_hosts_url(host_list_or_id=created_host.id)
-    response_status, response_data = api_patch(url, patch_doc, extra_headers=headers)
+    response_status, _ = api_patch(url, patch_doc, extra_headers=headers, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     assert_patch_event_is_valid(
@@ -265,7 +280,7 @@ def test_patch_produces_update_event_no_insights_id(
     patch_doc = {"display_name": "patch_event_test"}
 
     url = build_hosts_url(host_list_or_id=created_host.id)
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     assert_patch_event_is_valid(
@@ -280,7 +295,7 @@ def test_patch_by_namespace_produces_update_event(event_producer_mock, event_dat
     created_host = db_create_host(host=db_host(), extra_data={"facts": DB_FACTS})
 
     facts_url = build_facts_url(host_list_or_id=created_host.id, namespace=DB_FACTS_NAMESPACE)
-    response_status, _ = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     assert_patch_event_is_valid(
@@ -300,7 +315,7 @@ def test_patch_by_namespace_on_multiple_hosts_produces_multiple_update_events(
     created_hosts = db_create_multiple_hosts(how_many=2, extra_data={"facts": DB_FACTS})
 
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
-    response_status, _ = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     assert event_producer.write_event.call_count == 2
@@ -326,7 +341,7 @@ def test_event_producer_instrumentation(mocker, event_producer, db_create_host,
 
     patch_doc = {"display_name": "patch_event_test"}
 
-    response_status, response_data = api_patch(url, patch_doc)
+    response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
     assert mocked_callback_function.called_once()
@@ -345,13 +360,13 @@ def test_add_facts_to_multiple_hosts(event_producer_mock, db_create_multiple_hos
     host_id_list = get_id_list_from_hosts(created_hosts)
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=200)
 
     expected_facts = get_expected_facts_after_update("add", DB_FACTS_NAMESPACE, DB_FACTS, DB_NEW_FACTS)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
 
 def test_add_facts_to_multiple_hosts_with_branch_id(
@@ -362,12 +377,12 @@ def test_add_facts_to_multiple_hosts_with_branch_id(
     host_id_list = get_id_list_from_hosts(created_hosts)
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE, query="?branch_id=1234")
 
-    response_status, response_data = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     expected_facts = get_expected_facts_after_update("add", DB_FACTS_NAMESPACE, DB_FACTS, DB_NEW_FACTS)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
 
 def test_add_facts_to_multiple_hosts_including_nonexistent_host(db_create_multiple_hosts, db_get_hosts, api_patch):
@@ -376,7 +391,7 @@ def test_add_facts_to_multiple_hosts_including_nonexistent_host(db_create_multip
     url_host_id_list = f"{build_id_list_for_url(created_hosts)},{generate_uuid()},{generate_uuid()}"
     facts_url = build_facts_url(host_list_or_id=url_host_id_list, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -391,12 +406,12 @@ def test_add_facts_to_multiple_hosts_overwrite_empty_key_value_pair(
     host_id_list = get_id_list_from_hosts(created_hosts)
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     expected_facts = get_expected_facts_after_update("add", DB_FACTS_NAMESPACE, facts, DB_NEW_FACTS)
 
-    assert all(host.facts == expected_facts for host in db_get_hosts(host_id_list))
+    assert [host.facts for host in db_get_hosts(host_id_list)] == [expected_facts] * len(host_id_list)
 
 
 def test_add_facts_to_multiple_hosts_add_empty_fact_set(db_create_multiple_hosts, api_patch):
@@ -406,7 +421,7 @@ def test_add_facts_to_multiple_hosts_add_empty_fact_set(db_create_multiple_hosts
 
     facts_url = build_facts_url(created_hosts, DB_FACTS_NAMESPACE)
 
-    response_status, response_data = api_patch(facts_url, new_facts)
+    response_status, _ = api_patch(facts_url, new_facts, return_response_as_json=False)
     assert_response_status(response_status, expected_status=400)
 
 
@@ -419,7 +434,7 @@ def test_add_facts_to_namespace_that_does_not_exist(db_create_multiple_hosts, ap
 
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace="imanonexistentnamespace")
 
-    response_status, response_data = api_patch(facts_url, facts_to_update)
+    response_status, _ = api_patch(facts_url, facts_to_update, return_response_as_json=False)
     assert_response_status(response_status, expected_status=400)
 
 
@@ -434,7 +449,7 @@ def test_add_facts_to_multiple_culled_hosts(db_create_multiple_hosts, db_get_hos
     facts_url = build_facts_url(host_list_or_id=created_hosts, namespace=DB_FACTS_NAMESPACE)
 
     # Try to replace the facts on a host that has been marked as culled
-    response_status, response_data = api_patch(facts_url, DB_NEW_FACTS)
+    response_status, _ = api_patch(facts_url, DB_NEW_FACTS, return_response_as_json=False)
 
     assert_response_status(response_status, expected_status=400)
 
@@ -450,7 +465,7 @@ def test_patch_host_with_RBAC_allowed(subtests, mocker, api_patch, db_create_hos
             host = db_create_host()
 
             url = build_hosts_url(host_list_or_id=host.id)
-            response_status, response_data = api_patch(url, {"display_name": "fred_flintstone"})
+            response_status, _ = api_patch(url, {"display_name": "fred_flintstone"}, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -470,7 +485,7 @@ def test_patch_host_with_RBAC_denied(
             url = build_hosts_url(host_list_or_id=host.id)
 
             new_display_name = "fred_flintstone"
-            response_status, response_data = api_patch(url, {"display_name": new_display_name})
+            response_status, _ = api_patch(url, {"display_name": new_display_name}, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -513,7 +528,7 @@ def test_patch_host_with_RBAC_allowed_ungrouped(mocker, api_patch, db_create_hos
     url = build_hosts_url(host_list_or_id=host.id)
 
     new_display_name = "fred_flintstone"
-    response_status, response_data = api_patch(url, {"display_name": new_display_name})
+    response_status, _ = api_patch(url, {"display_name": new_display_name}, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -524,11 +539,14 @@ def test_patch_host_with_RBAC_bypassed_as_system(api_patch, db_create_host, even
     )
 
     url = build_hosts_url(host_list_or_id=host.id)
-    response_status, response_data = api_patch(url, {"display_name": "fred_flintstone"}, SYSTEM_IDENTITY)
+    response_status, _ = api_patch(
+        url, {"display_name": "fred_flintstone"}, SYSTEM_IDENTITY, return_response_as_json=False
+    )
 
     assert_response_status(response_status, 200)
 
 
+@pytest.mark.db_commit
 def test_update_delete_race(event_producer, db_create_host, db_get_host, api_patch, api_delete_host, mocker):
     mocker.patch.object(event_producer, "write_event")
     mocker.patch("lib.host_delete.kafka_available")
@@ -550,7 +568,7 @@ def test_update_delete_race(event_producer, db_create_host, db_get_host, api_pat
     patchThread.start()
 
     # as PATCH is running, concurrently delete the host
-    response_status, response_data = api_delete_host(host.id)
+    response_status, _ = api_delete_host(host.id, return_response_as_json=False)
     assert_response_status(response_status, expected_status=200)
 
     # wait for PATCH to finish
@@ -577,7 +595,7 @@ def test_patch_updated_timestamp(event_producer, db_create_host, db_get_host, ap
     host = db_create_host()
     patch_doc = {"display_name": "update_test"}
     url = build_hosts_url(host_list_or_id=host.id)
-    patch_response_status, patch_response_data = api_patch(url, patch_doc)
+    patch_response_status, _ = api_patch(url, patch_doc, return_response_as_json=False)
 
     assert_response_status(patch_response_status, expected_status=200)
 
@@ -93,7 +93,7 @@ def test_get_resource_types_RBAC_allowed(mocker, api_get, url_builder, enable_rb
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_get(url_builder())
+    response_status, _ = api_get(url_builder(), return_response_as_json=False)
     assert_response_status(response_status, 200)
 
 
@@ -112,6 +112,6 @@ def test_get_resource_types_RBAC_denied(mocker, api_get, url_builder, subtests,
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_get(url_builder())
+            response_status, _ = api_get(url_builder(), return_response_as_json=False)
 
             assert_response_status(response_status, 403)
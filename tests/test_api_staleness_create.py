@@ -52,10 +52,10 @@ def test_create_staleness_with_only_one_data(api_create_staleness, db_get_stalen
 
 
 def test_create_same_staleness(api_create_staleness):
-    response_status, response_data = api_create_staleness(_INPUT_DATA)
+    response_status, _ = api_create_staleness(_INPUT_DATA, return_response_as_json=False)
     assert_response_status(response_status, 201)
 
-    response_status, response_data = api_create_staleness(_INPUT_DATA)
+    response_status, _ = api_create_staleness(_INPUT_DATA, return_response_as_json=False)
     assert_response_status(response_status, 400)
 
 
@@ -63,7 +63,7 @@ def test_create_staleness_with_wrong_input(api_create_staleness):
     input_data = {
         "test_wrong_payload_data": "1",
     }
-    response_status, response_data = api_create_staleness(input_data)
+    response_status, _ = api_create_staleness(input_data, return_response_as_json=False)
     assert_response_status(response_status, 400)
 
 
@@ -76,7 +76,7 @@ def test_create_staleness_rbac_allowed(subtests, mocker, api_create_staleness, d
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_create_staleness(_INPUT_DATA)
+            response_status, _ = api_create_staleness(_INPUT_DATA, return_response_as_json=False)
 
             assert_response_status(response_status, 201)
 
@@ -90,6 +90,6 @@ def test_create_staleness_rbac_denied(subtests, mocker, api_create_staleness, db
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_create_staleness(_INPUT_DATA)
+            response_status, _ = api_create_staleness(_INPUT_DATA, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
@@ -14,7 +14,7 @@ def test_delete_existing_staleness(db_create_staleness_culling, api_delete_stale
         immutable_culling_delta=120,
     )
 
-    response_status, response_data = api_delete_staleness()
+    response_status, _ = api_delete_staleness(return_response_as_json=False)
     assert_response_status(response_status, 204)
 
     # checking if the record was really removed
@@ -23,7 +23,7 @@ def test_delete_existing_staleness(db_create_staleness_culling, api_delete_stale
 
 
 def test_delete_non_existing_staleness(api_delete_staleness):
-    response_status, response_data = api_delete_staleness()
+    response_status, _ = api_delete_staleness(return_response_as_json=False)
     assert_response_status(response_status, 404)
 
 
@@ -47,7 +47,7 @@ def test_delete_staleness_rbac_allowed(
                 immutable_culling_delta=120,
             )
 
-            response_status, _ = api_delete_staleness()
+            response_status, _ = api_delete_staleness(return_response_as_json=False)
 
             assert_response_status(response_status, 204)
 
@@ -61,6 +61,6 @@ def test_delete_staleness_rbac_denied(subtests, mocker, api_delete_staleness, en
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_delete_staleness()
+            response_status, _ = api_delete_staleness(return_response_as_json=False)
 
             assert_response_status(response_status, 403)
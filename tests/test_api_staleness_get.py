@@ -25,7 +25,7 @@ def test_get_default_staleness(api_get):
 
 
 def test_get_custom_staleness(api_create_staleness, api_get, clean_g):
-    created_response_status, _ = api_create_staleness(_INPUT_DATA)
+    created_response_status, _ = api_create_staleness(_INPUT_DATA, return_response_as_json=False)
     url = build_staleness_url()
     response_status, response_data = api_get(url)
     assert response_data["conventional_staleness_delta"] == _INPUT_DATA["conventional_staleness_delta"]
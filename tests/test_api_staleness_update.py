@@ -11,14 +11,14 @@ def test_update_existing_record(api_patch, db_create_staleness_culling):
     saved_staleness = db_create_staleness_culling(conventional_staleness_delta=1)
 
     url = build_staleness_url()
-    response_status, response_data = api_patch(url, host_data=_INPUT_DATA)
+    response_status, _ = api_patch(url, host_data=_INPUT_DATA, return_response_as_json=False)
     assert_response_status(response_status, 200)
     assert saved_staleness.conventional_staleness_delta == 99
 
 
 def test_update_non_existing_record(api_patch):
     url = build_staleness_url()
-    response_status, response_data = api_patch(url, host_data=_INPUT_DATA)
+    response_status, _ = api_patch(url, host_data=_INPUT_DATA, return_response_as_json=False)
     assert_response_status(response_status, 404)
 
 
@@ -33,7 +33,7 @@ def test_update_staleness_rbac_allowed(subtests, mocker, api_patch, db_create_st
             url = build_staleness_url()
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_patch(url, _INPUT_DATA)
+            response_status, _ = api_patch(url, _INPUT_DATA, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -49,6 +49,6 @@ def test_update_staleness_rbac_denied(subtests, mocker, api_patch, db_create_sta
             url = build_staleness_url()
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, _ = api_patch(url, _INPUT_DATA)
+            response_status, _ = api_patch(url, _INPUT_DATA, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
@@ -19,7 +19,7 @@ from tests.helpers.test_utils import get_staleness_timestamps
 
 def test_dont_get_only_culled(mq_create_hosts_in_all_states, api_get):
     url = build_hosts_url(query="?staleness=culled")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -47,7 +47,7 @@ def test_tags_count_default_ignores_culled(mq_create_hosts_in_all_states, api_ge
 def test_patch_ignores_culled(mq_create_hosts_in_all_states, api_patch):
     culled_host = mq_create_hosts_in_all_states["culled"]
     url = build_hosts_url(host_list_or_id=[culled_host])
-    response_status, response_data = api_patch(url, {"display_name": "patched"})
+    response_status, _ = api_patch(url, {"display_name": "patched"}, return_response_as_json=False)
 
     assert response_status == 404
 
@@ -56,7 +56,7 @@ def test_patch_works_on_non_culled(mq_create_hosts_in_all_states, api_patch):
     fresh_host = mq_create_hosts_in_all_states["fresh"]
 
     url = build_hosts_url(host_list_or_id=[fresh_host])
-    response_status, response_data = api_patch(url, {"display_name": "patched"})
+    response_status, _ = api_patch(url, {"display_name": "patched"}, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -65,7 +65,7 @@ def test_patch_facts_ignores_culled(mq_create_hosts_in_all_states, api_patch):
     culled_host = mq_create_hosts_in_all_states["culled"]
 
     url = build_facts_url(host_list_or_id=[culled_host], namespace="ns1")
-    response_status, response_data = api_patch(url, {"ARCHITECTURE": "patched"})
+    response_status, _ = api_patch(url, {"ARCHITECTURE": "patched"}, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -74,7 +74,7 @@ def test_patch_facts_works_on_non_culled(mq_create_hosts_in_all_states, api_patc
     fresh_host = mq_create_hosts_in_all_states["fresh"]
 
     url = build_facts_url(host_list_or_id=[fresh_host], namespace="ns1")
-    response_status, response_data = api_patch(url, {"ARCHITECTURE": "patched"})
+    response_status, _ = api_patch(url, {"ARCHITECTURE": "patched"}, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -84,7 +84,7 @@ def test_put_facts_ignores_culled(mq_create_hosts_in_all_states, api_put):
 
     url = build_facts_url(host_list_or_id=[culled_host], namespace="ns1")
 
-    response_status, response_data = api_put(url, {"ARCHITECTURE": "patched"})
+    response_status, _ = api_put(url, {"ARCHITECTURE": "patched"}, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -93,7 +93,7 @@ def test_put_facts_works_on_non_culled(mq_create_hosts_in_all_states, api_put):
     fresh_host = mq_create_hosts_in_all_states["fresh"]
 
     url = build_facts_url(host_list_or_id=[fresh_host], namespace="ns1")
-    response_status, response_data = api_put(url, {"ARCHITECTURE": "patched"})
+    response_status, _ = api_put(url, {"ARCHITECTURE": "patched"}, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -101,7 +101,7 @@ def test_put_facts_works_on_non_culled(mq_create_hosts_in_all_states, api_put):
 def test_delete_ignores_culled(mq_create_hosts_in_all_states, api_delete_host):
     culled_host = mq_create_hosts_in_all_states["culled"]
 
-    response_status, response_data = api_delete_host(culled_host.id)
+    response_status, _ = api_delete_host(culled_host.id, return_response_as_json=False)
 
     assert response_status == 404
 
@@ -109,7 +109,7 @@ def test_delete_ignores_culled(mq_create_hosts_in_all_states, api_delete_host):
 def test_delete_works_on_non_culled(mq_create_hosts_in_all_states, api_delete_host):
     fresh_host = mq_create_hosts_in_all_states["fresh"]
 
-    response_status, response_data = api_delete_host(fresh_host.id)
+    response_status, _ = api_delete_host(fresh_host.id, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -118,7 +118,7 @@ def test_get_host_by_id_doesnt_use_staleness_parameter(mq_create_hosts_in_all_st
     created_hosts = mq_create_hosts_in_all_states
 
     url = build_hosts_url(host_list_or_id=created_hosts)
-    response_status, response_data = api_get(url, query_parameters={"staleness": "fresh"})
+    response_status, _ = api_get(url, query_parameters={"staleness": "fresh"}, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -127,7 +127,7 @@ def test_tags_doesnt_use_staleness_parameter(mq_create_hosts_in_all_states, api_
     created_hosts = mq_create_hosts_in_all_states
 
     url = build_host_tags_url(host_list_or_id=created_hosts)
-    response_status, response_data = api_get(url, query_parameters={"staleness": "fresh"})
+    response_status, _ = api_get(url, query_parameters={"staleness": "fresh"}, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -136,7 +136,7 @@ def test_tags_count_doesnt_use_staleness_parameter(mq_create_hosts_in_all_states
     created_hosts = mq_create_hosts_in_all_states
 
     url = build_tags_count_url(host_list_or_id=created_hosts)
-    response_status, response_data = api_get(url, query_parameters={"staleness": "fresh"})
+    response_status, _ = api_get(url, query_parameters={"staleness": "fresh"}, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -145,7 +145,7 @@ def test_system_profile_doesnt_use_staleness_parameter(mq_create_hosts_in_all_st
     created_hosts = mq_create_hosts_in_all_states
 
     url = build_system_profile_url(host_list_or_id=created_hosts)
-    response_status, response_data = api_get(url, query_parameters={"staleness": "fresh"})
+    response_status, _ = api_get(url, query_parameters={"staleness": "fresh"}, return_response_as_json=False)
 
     assert response_status == 400
 
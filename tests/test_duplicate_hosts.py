@@ -22,6 +22,9 @@ ELEVATED_IDS = ("provider_id", "insights_id", "subscription_manager_id")
 CANONICAL_FACTS = ("fqdn", "satellite_id", "bios_uuid", "ip_addresses", "mac_addresses")
 logger = get_logger(__name__)
 
+# host_delete_duplicates reads the hosts through its own database sessions
+pytestmark = pytest.mark.db_commit
+
 
 @pytest.mark.host_delete_duplicates
 def test_delete_duplicate_host(event_producer_mock, db_create_host, db_get_host, inventory_config):
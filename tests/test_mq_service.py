@@ -811,7 +811,7 @@ def test_add_host_empty_keys_facts(facts, mocker, mq_create_or_update_host):
     mock_notification_event_producer.write_event.assert_called_once()
 
 
-@pytest.mark.parametrize("stale_timestamp", ("invalid", datetime.now().isoformat()))
+@pytest.mark.parametrize("stale_timestamp", ("invalid", pytest.param(datetime.now().isoformat(), id="timezone-naive")))
 def test_add_host_with_invalid_stale_timestamp(stale_timestamp, mocker, mq_create_or_update_host):
     mock_notification_event_producer = mocker.Mock()
     insights_id = generate_uuid()
@@ -62,7 +62,7 @@ def test_payload_tracker_producer_raises_exception(payload_tracker, tracker_date
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, _ in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             # This method should NOT raise an exception...even though
             # the producer is causing an exception
             method_to_test(status_message="expected_status_msg")
@@ -79,7 +79,7 @@ def test_payload_tracker_json_raises_exception(mocker, payload_tracker, tracker_
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, _ in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             # This method should NOT raise an exception...even though
             # the producer is causing an exception
             method_to_test()
@@ -94,7 +94,7 @@ def test_payload_tracker_account_is_none(payload_tracker, tracker_datetime_mock,
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, expected_status in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             method_to_test()
 
             expected_msg = build_expected_tracker_message(
@@ -116,7 +116,7 @@ def test_payload_tracker_pass_status_message(payload_tracker, tracker_datetime_m
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, expected_status in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             method_to_test(status_message=expected_status_msg)
 
             expected_msg = build_expected_tracker_message(
@@ -141,7 +141,7 @@ def test_payload_tracker_set_account_and_request_id(payload_tracker, tracker_dat
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, expected_status in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             method_to_test()
 
             expected_msg = build_expected_tracker_message(
@@ -166,7 +166,7 @@ def test_payload_tracker_set_org_id_and_request_id(payload_tracker, tracker_date
     methods_to_test = get_payload_tracker_methods(tracker)
 
     for method_to_test, expected_status in methods_to_test:
-        with subtests.test(method_to_test=method_to_test):
+        with subtests.test(method_to_test=method_to_test.__name__):
             method_to_test()
 
             expected_msg = build_expected_tracker_message(
@@ -58,7 +58,7 @@ def test_RBAC_invalid_attribute_filter(mocker, api_get, field, enable_rbac):
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_get(build_hosts_url())
+    response_status, _ = api_get(build_hosts_url(), return_response_as_json=False)
 
     assert_response_status(response_status, 503)
 
@@ -73,7 +73,7 @@ def test_RBAC_invalid_UUIDs(mocker, api_get, enable_rbac):
 
     get_rbac_permissions_mock.return_value = mock_rbac_response
 
-    response_status, _ = api_get(build_hosts_url())
+    response_status, _ = api_get(build_hosts_url(), return_response_as_json=False)
 
     assert_response_status(response_status, 503)
 
@@ -84,6 +84,6 @@ def test_RBAC_invalid_UUIDs(mocker, api_get, enable_rbac):
 )
 def test_non_host_endpoints_cannot_bypass_RBAC(api_get, enable_rbac, url_builder):
     url = url_builder()
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 403)
@@ -130,7 +130,7 @@ def test_get_system_profile_sap_system_with_RBAC_allowed(
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -147,7 +147,7 @@ def test_get_system_profile_sap_sids_with_RBAC_allowed(
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -163,7 +163,7 @@ def test_get_system_profile_with_RBAC_denied(subtests, mocker, api_get, enable_r
             with subtests.test():
                 get_rbac_permissions_mock.return_value = mock_rbac_response
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert_response_status(response_status, 403)
 
@@ -173,7 +173,7 @@ def test_get_system_profile_sap_system_with_RBAC_bypassed_as_system(
 ):
     url = build_system_profile_sap_system_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -183,7 +183,7 @@ def test_get_system_profile_sap_sids_with_RBAC_bypassed_as_system(
 ):
     url = build_system_profile_sap_sids_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -198,7 +198,7 @@ def test_get_system_profile_RBAC_allowed(mocker, subtests, api_get, enable_rbac)
 
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
-            response_status, response_data = api_get(f"{HOST_URL}/{host_id}/system_profile")
+            response_status, _ = api_get(f"{HOST_URL}/{host_id}/system_profile", return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -216,7 +216,7 @@ def test_get_system_profile_RBAC_denied(mocker, subtests, api_get, enable_rbac):
 
         with subtests.test():
             get_rbac_permissions_mock.return_value = mock_rbac_response
-            response_status, response_data = api_get(f"{HOST_URL}/{host_id}/system_profile")
+            response_status, _ = api_get(f"{HOST_URL}/{host_id}/system_profile", return_response_as_json=False)
 
             assert_response_status(response_status, 403)
             find_hosts_by_staleness_mock.assert_not_called()
@@ -226,7 +226,7 @@ def test_get_host_with_invalid_system_profile(api_get, patch_xjoin_post):
     # patch xjoin post to respond with graphql_utils.XJOIN_INVALID_SYSTEM_PROFILE
     patch_xjoin_post(XJOIN_INVALID_SYSTEM_PROFILE)
     url = build_system_profile_url(host_list_or_id=generate_uuid())
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert_response_status(response_status, 500)
 
@@ -325,8 +325,10 @@ def test_validate_sp_for_missing_branch_or_repo(mocker):
 
 
 def test_validate_sp_for_invalid_days(api_post):
-    response_status, response_data = api_post(
-        url=f"{SYSTEM_PROFILE_URL}/validate_schema?repo_branch=master&days=0", host_data=None
+    response_status, _ = api_post(
+        url=f"{SYSTEM_PROFILE_URL}/validate_schema?repo_branch=master&days=0",
+        host_data=None,
+        return_response_as_json=False,
     )
 
     assert response_status == 400
@@ -27,7 +27,7 @@ def test_get_tags_of_multiple_hosts_query(
     created_hosts = mq_create_three_specific_hosts
 
     url = build_host_tags_url(host_list_or_id=created_hosts, query="?order_by=updated&order_how=ASC")
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
     graphql_query_empty_response.assert_called_once_with(
@@ -125,7 +125,7 @@ def test_get_tags_invalid_start_end(patch_xjoin_post, api_get, subtests):
     """
 
     url = build_tags_url(query="?updated_start=2022-01-19T15:00:00.000Z&updated_end=2020-01-19T15:00:00.000Z")
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert_response_status(response_status, 400)
 
@@ -286,7 +286,7 @@ def test_get_host_tags_with_RBAC_allowed(subtests, mocker, api_get, enable_rbac)
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
             url = build_host_tags_url(host_list_or_id=generate_uuid())
-            response_status, _ = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 200)
 
@@ -303,7 +303,7 @@ def test_get_host_tags_with_RBAC_denied(subtests, mocker, api_get, enable_rbac):
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
             url = build_host_tags_url(host_list_or_id=generate_uuid())
-            response_status, _ = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert_response_status(response_status, 403)
 
@@ -346,7 +346,7 @@ def test_get_host_tag_count_RBAC_denied(mq_create_four_specific_hosts, mocker, a
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
             url = build_tags_count_url(host_list_or_id=created_hosts, query="?order_by=updated&order_how=ASC")
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 403
 
@@ -357,7 +357,7 @@ def test_get_host_tags_with_RBAC_bypassed_as_system(db_create_host, api_get, ena
     host = db_create_host(SYSTEM_IDENTITY, extra_data={"system_profile_facts": {"owner_id": generate_uuid()}})
 
     url = build_host_tags_url(host_list_or_id=host.id)
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert_response_status(response_status, 200)
 
@@ -16,6 +16,7 @@ from unittest.mock import patch
 from uuid import UUID
 from uuid import uuid4
 
+import pytest
 from confluent_kafka import KafkaException
 
 from api import api_operation
@@ -452,25 +453,6 @@ class CreateAppConnexionAppInitTestCase(TestCase):
         assert len(args) == 1
         assert args[0] is translating_parser.return_value.specification
 
-    def test_specification_is_parsed(self, get_engine, app):
-        create_app(RuntimeEnvironment.TEST)
-        app.return_value.add_api.assert_called_once()
-        args = app.return_value.add_api.mock_calls[0].args
-        assert len(args) == 1
-        assert args[0] is not None
-
-    # Test here the parsing is working with the referenced schemas from system_profile.spec.yaml
-    # and the check parser.specification["components"]["schemas"] - this is more a library test
-    def test_translatingparser(self, get_engine, app):
-        create_app(RuntimeEnvironment.TEST)
-        # Check whether SystemProfileNetworkInterface is inside the schemas section
-        # add_api uses the specification as firts argument
-        specification = app.return_value.add_api.mock_calls[0].args
-        assert "SystemProfileNetworkInterface" in specification[0]["components"]["schemas"]
-
-        # This will pass with openapi.json because the schemas are inlined
-        # This will pass when the library acts as it should, inlining the referenced schemas
-
     # Create an app with bad defs assert that it wont create and will raise and exception
     @patch("app.SPECIFICATION_FILE", value="./swagger/api.spec.yaml")
     def test_yaml_specification(self, translating_parser, get_engine, app):
@@ -479,6 +461,32 @@ class CreateAppConnexionAppInitTestCase(TestCase):
                 create_app(RuntimeEnvironment.TEST)
 
 
+@pytest.fixture(scope="module")
+def add_api_args():
+    # Parsing the specification is slow, so the app is created only once for the tests below.
+    with patch("app.connexion.App") as app, patch("app.db.get_engine"):
+        create_app(RuntimeEnvironment.TEST)
+
+    app.return_value.add_api.assert_called_once()
+    return app.return_value.add_api.mock_calls[0].args
+
+
+def test_specification_is_parsed(add_api_args):
+    assert len(add_api_args) == 1
+    assert add_api_args[0] is not None
+
+
+# Test here the parsing is working with the referenced schemas from system_profile.spec.yaml
+# and the check parser.specification["components"]["schemas"] - this is more a library test
+def test_translatingparser(add_api_args):
+    # Check whether SystemProfileNetworkInterface is inside the schemas section
+    # add_api uses the specification as firts argument
+    assert "SystemProfileNetworkInterface" in add_api_args[0]["components"]["schemas"]
+
+    # This will pass with openapi.json because the schemas are inlined
+    # This will pass when the library acts as it should, inlining the referenced schemas
+
+
 class HostOrderHowTestCase(TestCase):
     def test_asc(self):
         column = Mock()
@@ -44,8 +44,8 @@ def test_headers_forwarded(mocker, patch_xjoin_post, api_get):
     post = patch_xjoin_post({"data": EMPTY_HOSTS_RESPONSE})
 
     request_id = generate_uuid()
-    response_status, response_data = api_get(
-        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}
+    response_status, _ = api_get(
+        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}, return_response_as_json=False
     )
 
     assert response_status == 200
@@ -57,8 +57,8 @@ def test_host_request_xjoin_status_403(patch_xjoin_post, api_get):
     patch_xjoin_post(response={"data": EMPTY_HOSTS_RESPONSE}, status=403)
     request_id = generate_uuid()
 
-    response_status, response_data = api_get(
-        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}
+    response_status, _ = api_get(
+        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}, return_response_as_json=False
     )
 
     assert response_status == 500
@@ -69,8 +69,8 @@ def test_host_request_xjoin_invalid_response(patch_xjoin_post, api_get, response
     patch_xjoin_post(response={"data": response_data}, status=200)
     request_id = generate_uuid()
 
-    response_status, response_data = api_get(
-        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}
+    response_status, _ = api_get(
+        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}, return_response_as_json=False
     )
 
     assert response_status == 503
@@ -80,8 +80,8 @@ def test_host_request_xjoin_status_200(patch_xjoin_post, api_get):
     patch_xjoin_post(response={"data": EMPTY_HOSTS_RESPONSE}, status=200)
     request_id = generate_uuid()
 
-    response_status, response_data = api_get(
-        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}
+    response_status, _ = api_get(
+        HOST_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}, return_response_as_json=False
     )
 
     assert response_status == 200
@@ -89,7 +89,7 @@ def test_host_request_xjoin_status_200(patch_xjoin_post, api_get):
 
 def test_query_all_hosts(mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url()
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -120,7 +120,7 @@ def test_query_variables_fqdn(mocker, graphql_query_empty_response, api_get):
     fqdn = "host.DOMAIN.com"
 
     url = build_hosts_url(query=f"?fqdn={quote(fqdn)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -142,7 +142,7 @@ def test_query_variables_display_name(mocker, graphql_query_empty_response, api_
     display_name = "my awesome host uwu"
 
     url = build_hosts_url(query=f"?display_name={quote(display_name)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -164,7 +164,7 @@ def test_query_variables_hostname_or_id_non_uuid(mocker, graphql_query_empty_res
     hostname_or_id = "host.domain.com"
 
     url = build_hosts_url(query=f"?hostname_or_id={quote(hostname_or_id)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -194,7 +194,7 @@ def test_query_variables_hostname_or_id_uuid(mocker, graphql_query_empty_respons
     hostname_or_id = generate_uuid()
 
     url = build_hosts_url(query=f"?hostname_or_id={quote(hostname_or_id)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -225,7 +225,7 @@ def test_query_variables_insights_id(mocker, graphql_query_empty_response, api_g
     insights_id = generate_uuid().upper()
 
     url = build_hosts_url(query=f"?insights_id={quote(insights_id)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -246,7 +246,7 @@ def test_query_variables_insights_id(mocker, graphql_query_empty_response, api_g
 @pytest.mark.parametrize("provider_type", ("alibaba", "aws", "azure", "gcp", "ibm"))
 def test_query_variables_provider_type(mocker, graphql_query_empty_response, api_get, provider_type):
     url = build_hosts_url(query=f"?provider_type={provider_type}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -268,7 +268,7 @@ def test_query_variables_provider_id(mocker, graphql_query_empty_response, api_g
     provider_id = generate_uuid()
 
     url = build_hosts_url(query=f"?provider_id={quote(provider_id)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -289,7 +289,7 @@ def test_query_variables_provider_id(mocker, graphql_query_empty_response, api_g
 def test_query_variables_updated_too_old_timestamp(mocker, graphql_query_empty_response, api_get):
     # testing both timestamp with too old.
     url = build_hosts_url(query="?updated_start=0199-03-04T04:56:02.000Z&updated_end=0199-03-04T04:56:02.000Z")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -308,7 +308,7 @@ def test_query_variables_updated_too_old_timestamp(mocker, graphql_query_empty_r
 
     # testing updated_end with too old.
     url = build_hosts_url(query="?updated_start=2001-03-04T04:56:02.000Z&updated_end=0199-03-04T04:56:02.000Z")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -316,7 +316,7 @@ def test_query_variables_updated_too_old_timestamp(mocker, graphql_query_empty_r
 
     # testing updated_start with too old.
     url = build_hosts_url(query="?updated_start=0199-03-04T04:56:02.000Z&updated_end=2010-03-04T04:56:02.000Z")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -346,7 +346,7 @@ def test_query_variables_updated_too_old_timestamp(mocker, graphql_query_empty_r
 )
 def test_query_variables_provider_type_and_id(mocker, graphql_query_empty_response, api_get, provider):
     url = build_hosts_url(query=f'?provider_type={provider["type"]}&provider_id={provider["id"]}')
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -371,7 +371,7 @@ def test_query_variables_provider_type_and_id(mocker, graphql_query_empty_respon
 @pytest.mark.parametrize("provider_type", ("invalid", " ", "\t"))
 def test_query_using_invalid_provider_type(mocker, graphql_query_empty_response, api_get, provider_type):
     url = build_hosts_url(query=f"?provider_type={provider_type}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -379,7 +379,7 @@ def test_query_using_invalid_provider_type(mocker, graphql_query_empty_response,
 
 
 def test_query_variables_none(mocker, graphql_query_empty_response, api_get):
-    response_status, response_data = api_get(HOST_URL)
+    response_status, _ = api_get(HOST_URL, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -400,17 +400,28 @@ def test_query_variables_none(mocker, graphql_query_empty_response, api_get):
 @pytest.mark.parametrize(
     "query",
     (
-        (f"fqdn={quote(generate_uuid())}&display_name={quote(generate_uuid())}"),
-        (f"fqdn={quote(generate_uuid())}&hostname_or_id={quote(generate_uuid())}"),
-        (f"fqdn={quote(generate_uuid())}&insights_id={quote(generate_uuid())}"),
-        (f"display_name={quote(generate_uuid())}&hostname_or_id={quote(generate_uuid())}"),
-        (f"display_name={quote(generate_uuid())}&insights_id={quote(generate_uuid())}"),
-        (f"hostname_or_id={quote(generate_uuid())}&insights_id={quote(generate_uuid())}"),
+        pytest.param(f"fqdn={quote(generate_uuid())}&display_name={quote(generate_uuid())}", id="fqdn-display_name"),
+        pytest.param(
+            f"fqdn={quote(generate_uuid())}&hostname_or_id={quote(generate_uuid())}", id="fqdn-hostname_or_id"
+        ),
+        pytest.param(f"fqdn={quote(generate_uuid())}&insights_id={quote(generate_uuid())}", id="fqdn-insights_id"),
+        pytest.param(
+            f"display_name={quote(generate_uuid())}&hostname_or_id={quote(generate_uuid())}",
+            id="display_name-hostname_or_id",
+        ),
+        pytest.param(
+            f"display_name={quote(generate_uuid())}&insights_id={quote(generate_uuid())}",
+            id="display_name-insights_id",
+        ),
+        pytest.param(
+            f"hostname_or_id={quote(generate_uuid())}&insights_id={quote(generate_uuid())}",
+            id="hostname_or_id-insights_id",
+        ),
     ),
 )
 def test_query_variables_invalid(query, mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=f"?{query}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -436,7 +447,7 @@ def test_query_variables_invalid(query, mocker, graphql_query_empty_response, ap
 )
 def test_query_variables_tags(tags, query_param, mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=f"{query_param}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -464,7 +475,7 @@ def test_query_variables_tags_with_search(field, mocker, graphql_query_empty_res
     value = quote(generate_uuid())
 
     url = build_hosts_url(query=f"?{field}={value}&tags=a/b=c")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -518,7 +529,7 @@ def _build_prs_array(mocker, reporters):
 def test_query_variables_registered_with_per_reporter(mocker, graphql_query_empty_response, api_get, reporters):
     url = build_hosts_url(query="?" + "&".join([f"registered_with={reporter}" for reporter in reporters]))
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -544,7 +555,7 @@ def test_query_variables_registered_with_per_reporter(mocker, graphql_query_empt
 @pytest.mark.parametrize("direction", ("ASC", "DESC"))
 def test_query_variables_ordering_dir(direction, mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=f"?order_by=updated&order_how={quote(direction)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -575,7 +586,7 @@ def test_query_variables_ordering_by(
     params_order_by, xjoin_order_by, default_xjoin_order_how, mocker, graphql_query_empty_response, api_get
 ):
     url = build_hosts_url(query=f"?order_by={quote(params_order_by)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -595,7 +606,7 @@ def test_query_variables_ordering_by(
 
 def test_query_variables_ordering_by_invalid(graphql_query_empty_response, api_get):
     url = build_hosts_url(query="?order_by=fqdn")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -604,7 +615,7 @@ def test_query_variables_ordering_by_invalid(graphql_query_empty_response, api_g
 
 def test_query_variables_ordering_dir_invalid(graphql_query_empty_response, api_get):
     url = build_hosts_url(query="?order_by=updated&order_how=REVERSE")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -613,7 +624,7 @@ def test_query_variables_ordering_dir_invalid(graphql_query_empty_response, api_
 
 def test_query_variables_ordering_dir_without_by(graphql_query_empty_response, api_get):
     url = build_hosts_url(query="?order_how=ASC")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -623,7 +634,7 @@ def test_query_variables_ordering_dir_without_by(graphql_query_empty_response, a
 @pytest.mark.parametrize("page,limit,offset", ((1, 2, 0), (2, 2, 2), (4, 50, 150)))
 def test_response_pagination(page, limit, offset, mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=f"?per_page={quote(limit)}&page={quote(page)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -644,7 +655,7 @@ def test_response_pagination(page, limit, offset, mocker, graphql_query_empty_re
 @pytest.mark.parametrize("page,per_page", ((0, 10), (-1, 10), (1, 0), (1, -5), (1, 101), (21474838, 100)))
 def test_response_invalid_pagination(page, per_page, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=f"?per_page={quote(per_page)}&page={quote(page)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -652,7 +663,7 @@ def test_response_invalid_pagination(page, per_page, graphql_query_empty_respons
 
 
 def test_query_variables_default_except_staleness(mocker, graphql_query_empty_response, api_get):
-    response_status, response_data = api_get(HOST_URL)
+    response_status, _ = api_get(HOST_URL, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -683,7 +694,7 @@ def test_query_variables_staleness(
     staleness, expected, mocker, culling_datetime_mock, graphql_query_empty_response, api_get
 ):
     url = build_hosts_url(query=f"?staleness={staleness}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -692,7 +703,7 @@ def test_query_variables_staleness(
 
 def test_query_multiple_staleness(mocker, culling_datetime_mock, graphql_query_empty_response, api_get):
     url = build_hosts_url(query="?staleness=fresh&staleness=stale_warning")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -709,10 +720,10 @@ def test_query_multiple_staleness(mocker, culling_datetime_mock, graphql_query_e
 @pytest.mark.parametrize(
     "field,value",
     (
-        ("fqdn", generate_uuid()),
+        pytest.param("fqdn", generate_uuid(), id="fqdn"),
         ("display_name", "some display name"),
         ("hostname_or_id", "some hostname"),
-        ("insights_id", generate_uuid()),
+        pytest.param("insights_id", generate_uuid(), id="insights_id"),
         ("tags", "some/tag"),
     ),
 )
@@ -720,7 +731,7 @@ def test_query_variables_staleness_with_search(
     field, value, mocker, culling_datetime_mock, graphql_query_empty_response, api_get
 ):
     url = build_hosts_url(query=f"?{field}={quote(value)}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -832,7 +843,7 @@ def test_response_processed_properly(graphql_query_with_response, api_get):
 
 def test_response_pagination_index_error(graphql_query_with_response, api_get):
     url = build_hosts_url(query="?per_page=2&page=3")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 404
 
@@ -863,7 +874,7 @@ def test_invalid_without_timezone(graphql_query, api_get):
     response = xjoin_host_response("2020-02-10T08:07:03.354307")
 
     graphql_query(return_value=response)
-    response_status, response_data = api_get(HOST_URL)
+    response_status, _ = api_get(HOST_URL, return_response_as_json=False)
 
     assert response_status == 500
 
@@ -872,8 +883,8 @@ def test_tags_headers_forwarded(mocker, patch_xjoin_post, api_get):
     post = patch_xjoin_post({"data": TAGS_EMPTY_RESPONSE})
 
     request_id = generate_uuid()
-    response_status, response_data = api_get(
-        TAGS_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}
+    response_status, _ = api_get(
+        TAGS_URL, extra_headers={"x-rh-insights-request-id": request_id, "foo": "bar"}, return_response_as_json=False
     )
 
     assert response_status == 200
@@ -892,8 +903,8 @@ def test_tags_query_variables_default_except_staleness(mocker, assert_tag_query_
         ("fqdn", "eq", "some fqdn"),
         ("fqdn", "eq", "some Capitalized FQDN"),
         ("display_name", "matches_lc", "*some display name*"),
-        ("insights_id", "eq", generate_uuid()),
-        ("insights_id", "eq", generate_uuid().upper()),
+        pytest.param("insights_id", "eq", generate_uuid(), id="insights_id-eq-lowercase"),
+        pytest.param("insights_id", "eq", generate_uuid().upper(), id="insights_id-eq-uppercase"),
         ("provider_id", "eq", "some-provider-id"),
         ("provider_id", "eq", "ANOTHER-provider-id"),
         ("provider_type", "eq", ProviderType.AZURE.value),
@@ -910,7 +921,7 @@ def test_tags_query_host_filters(assert_tag_query_host_filter_for_field, field,
     "field,matcher,value",
     (
         ("fqdn", "eq", "some Capitalized FQDN"),
-        ("insights_id", "eq", generate_uuid().upper()),
+        pytest.param("insights_id", "eq", generate_uuid().upper(), id="insights_id-eq-uppercase"),
         ("provider_id", "eq", "CAPITALIZED-provider-id"),
     ),
 )
@@ -1121,7 +1132,7 @@ def test_tags_query_variables_search(mocker, assert_tag_query_host_filter_single
 @pytest.mark.parametrize("direction", ["ASC", "DESC"])
 def test_tags_query_variables_ordering_dir(direction, mocker, graphql_tag_query_empty_response, api_get):
     url = build_tags_url(query=f"?order_how={direction}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1135,7 +1146,7 @@ def test_tags_query_variables_ordering_dir(direction, mocker, graphql_tag_query_
 @pytest.mark.parametrize("ordering", ["tag", "count"])
 def test_tags_query_variables_ordering_by(ordering, mocker, graphql_tag_query_empty_response, api_get):
     url = build_tags_url(query=f"?order_by={ordering}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1149,7 +1160,7 @@ def test_tags_query_variables_ordering_by(ordering, mocker, graphql_tag_query_em
 @pytest.mark.parametrize("page,limit,offset", [(1, 2, 0), (2, 2, 2), (4, 50, 150)])
 def test_tags_response_pagination(page, limit, offset, mocker, graphql_tag_query_empty_response, api_get):
     url = build_tags_url(query=f"?per_page={limit}&page={page}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1163,7 +1174,7 @@ def test_tags_response_pagination(page, limit, offset, mocker, graphql_tag_query
 @pytest.mark.parametrize("page,per_page", [(0, 10), (-1, 10), (1, 0), (1, -5), (1, 101), (21474838, 100)])
 def test_tags_response_invalid_pagination(page, per_page, api_get):
     url = build_tags_url(query=f"?per_page={per_page}&page={page}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -1207,7 +1218,7 @@ def test_tags_query_variables_registered_with_per_reporter(
 
 def test_tags_response_invalid_registered_with(api_get):
     url = build_tags_url(query="?registered_with=salad")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -1232,7 +1243,7 @@ def test_tags_response_processed_properly(graphql_tag_query_with_response, api_g
 
 def test_tags_response_pagination_index_error(mocker, graphql_tag_query_with_response, api_get):
     url = build_tags_url(query="?per_page=2&page=3")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 404
 
@@ -1386,7 +1397,7 @@ def test_tags_RBAC_denied(subtests, mocker, graphql_tag_query_empty_response, ap
             get_rbac_permissions_mock.return_value = mock_rbac_response
 
             url = build_tags_url(query="?registered_with=insights")
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 403
 
@@ -1396,7 +1407,7 @@ def test_tags_RBAC_denied(subtests, mocker, graphql_tag_query_empty_response, ap
 def test_system_profile_sap_system_endpoint(mocker, graphql_system_profile_sap_system_query_empty_response, api_get):
     url = build_system_profile_sap_system_url()
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
     graphql_system_profile_sap_system_query_empty_response.assert_called_once_with(
@@ -1428,7 +1439,7 @@ def test_system_profile_sap_system_endpoint_tags(
 ):
     url = build_system_profile_sap_system_url(query=query_param)
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     tag_filters = ({"OR": tuple({"tag": item} for item in tags)},)
     assert response_status == 200
@@ -1455,7 +1466,7 @@ def test_system_profile_sap_system_endpoint_registered_with_per_reporter(
         query="?" + "&".join([f"registered_with={reporter}" for reporter in reporters])
     )
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1477,7 +1488,7 @@ def test_system_profile_sap_system_endpoint_pagination(
 ):
     page, per_page = 1, 20
     url = build_system_profile_sap_system_url(query=f"?page={page}&per_page={per_page}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
     graphql_system_profile_sap_system_query_empty_response.assert_called_once_with(
@@ -1490,7 +1501,7 @@ def test_system_profile_sap_sids_endpoint_pagination(
 ):
     page, per_page = 1, 85
     url = build_system_profile_sap_sids_url(query=f"?page={page}&per_page={per_page}")
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
     graphql_system_profile_sap_sids_query_empty_response.assert_called_once_with(
@@ -1501,7 +1512,7 @@ def test_system_profile_sap_sids_endpoint_pagination(
 def test_system_profile_sap_sids_endpoint(mocker, graphql_system_profile_sap_sids_query_empty_response, api_get):
     url = build_system_profile_sap_sids_url()
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
     graphql_system_profile_sap_sids_query_empty_response.assert_called_once_with(
@@ -1533,7 +1544,7 @@ def test_system_profile_sap_sids_endpoint_tags(
 ):
     url = build_system_profile_sap_sids_url(query=query_param)
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     tag_filters = ({"OR": tuple({"tag": item} for item in tags)},)
     assert response_status == 200
@@ -1560,7 +1571,7 @@ def test_system_profile_sap_sids_endpoint_registered_with_per_reporter(
         query="?" + "&".join([f"registered_with={reporter}" for reporter in reporters])
     )
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1595,7 +1606,7 @@ def test_query_hosts_filter_spf_sap_system(mocker, subtests, graphql_query_empty
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1653,7 +1664,7 @@ def test_query_system_profile_sap_system_filter_spf_sap_sids(
                 graphql_system_profile_sap_system_query_empty_response.reset_mock()
                 url = build_system_profile_sap_system_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1679,7 +1690,7 @@ def test_query_hosts_filter_spf_sap_sids(mocker, subtests, graphql_query_empty_r
                 graphql_query_empty_response.reset_mock()
                 url = build_hosts_url(query="?" + "".join([f"filter{path}={value}&" for value in values]))
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1738,7 +1749,7 @@ def test_query_system_profile_sap_sids_filter_spf_sap_sids(
                     query="?" + "".join([f"filter{path}={value}&" for value in values])
                 )
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1754,7 +1765,7 @@ def test_query_system_profile_sap_sids_with_search(
 ):
     url = build_system_profile_sap_sids_url(query="?search=C2")
 
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -1783,7 +1794,7 @@ def test_query_hosts_filter_spf_is_marketplace(
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1819,7 +1830,7 @@ def test_query_hosts_filter_spf_rhc_client_id(
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -1860,7 +1871,7 @@ def test_query_hosts_filter_spf_rhc_client_id_multiple(
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -1938,7 +1949,7 @@ def test_query_hosts_filter_updated_start_end(mocker, subtests, api_get, graphql
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -1961,7 +1972,7 @@ def test_query_hosts_filter_updated_error(api_get):
     url = build_hosts_url(query="?updated_start=2023-02-08T09:00:00.000Z&updated_end=2020-02-08T09:00:00.000Z")
 
     # This request should return an HTTP 400 because the start time is after the end time.
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 400
 
@@ -1995,7 +2006,7 @@ def test_query_variables_group_name(mocker, graphql_query_empty_response, api_ge
     group_name_params = "&".join([f"group_name={quote(name)}" for name in group_names])
     # Verify that empty group_name values play nicely with other params (like fqdn)
     url = build_hosts_url(query=f"?{group_name_params}&fqdn=foo.bar.com")
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2102,7 +2113,7 @@ def test_query_hosts_filter_spf_owner_id(mocker, subtests, graphql_query_empty_r
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -2143,7 +2154,7 @@ def test_query_hosts_filter_spf_owner_id_multiple(
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -2195,7 +2206,7 @@ def test_query_hosts_filter_spf_host_type(mocker, subtests, graphql_query_empty_
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -2233,7 +2244,7 @@ def test_query_hosts_filter_spf_host_type_multiple(
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -2256,7 +2267,7 @@ def test_query_hosts_filter_spf_host_type_multiple(
 def test_query_hosts_feature_flag_filter_host_type(mocker, graphql_query_empty_response, api_get):
     mocker.patch("api.filtering.filtering.get_flag_value", return_value=True)
 
-    response_status, response_data = api_get(build_hosts_url())
+    response_status, _ = api_get(build_hosts_url(), return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2290,7 +2301,7 @@ def test_query_hosts_edge_feature_flag_other_sp_filters(mocker, subtests, graphq
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -2331,7 +2342,7 @@ def test_query_hosts_filter_update_method_multiple(
         with subtests.test(param=param, query=query):
             url = build_hosts_url(query=param)
 
-            response_status, response_data = api_get(url)
+            response_status, _ = api_get(url, return_response_as_json=False)
 
             assert response_status == 200
 
@@ -2383,7 +2394,7 @@ def test_query_hosts_filter_spf_insights_client_version(
             with subtests.test(value=value, query=query, path=path):
                 url = build_hosts_url(query=f"?filter{path}={value}")
 
-                response_status, response_data = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
 
                 assert response_status == 200
 
@@ -2704,7 +2715,7 @@ def test_query_hosts_filter_spf_ansible_exception_handling(subtests, api_get):
 def test_query_hosts_system_identity(mocker, subtests, graphql_query_empty_response, api_get):
     url = build_hosts_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2725,7 +2736,7 @@ def test_query_hosts_system_identity(mocker, subtests, graphql_query_empty_respo
 def test_query_tags_system_identity(mocker, subtests, graphql_tag_query_empty_response, api_get):
     url = build_tags_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2747,7 +2758,7 @@ def test_query_system_profile_sap_sids_system_identity(
 ):
     url = build_system_profile_sap_sids_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2763,7 +2774,7 @@ def test_query_system_profile_sap_system_system_identity(
 ):
     url = build_system_profile_sap_system_url()
 
-    response_status, response_data = api_get(url, SYSTEM_IDENTITY)
+    response_status, _ = api_get(url, SYSTEM_IDENTITY, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2777,7 +2788,7 @@ def test_query_system_profile_sap_system_system_identity(
 def test_query_with_owner_id_satellite_identity(mocker, subtests, graphql_query_empty_response, api_get):
     url = build_hosts_url()
 
-    response_status, response_data = api_get(url, SATELLITE_IDENTITY)
+    response_status, _ = api_get(url, SATELLITE_IDENTITY, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2894,7 +2905,7 @@ def test_sp_sparse_xjoin_query_translation(
         {"stale_timestamp": mocker.ANY, "OR": [{"id": {"eq": host_one_id}}, {"id": {"eq": host_two_id}}]},
     )
 
-    response_status, _ = api_get(build_system_profile_url(hosts, query=query))
+    response_status, _ = api_get(build_system_profile_url(hosts, query=query), return_response_as_json=False)
 
     assert response_status == 200
     graphql_sparse_system_profile_empty_response.assert_called_once_with(
@@ -2909,7 +2920,9 @@ def test_sp_sparse_xjoin_query_translation(
         {"spf_owner_id": {"eq": SYSTEM_IDENTITY["system"]["cn"]}},
     )
 
-    response_status, _ = api_get(build_system_profile_url(hosts, query=query), identity=SYSTEM_IDENTITY)
+    response_status, _ = api_get(
+        build_system_profile_url(hosts, query=query), identity=SYSTEM_IDENTITY, return_response_as_json=False
+    )
 
     assert response_status == 200
     graphql_sparse_system_profile_empty_response.assert_called_once_with(
@@ -2930,7 +2943,7 @@ def test_sp_sparse_xjoin_query_translation(
 )
 def test_get_hosts_fields_param(query, fields, mocker, graphql_query_empty_response, api_get):
     url = build_hosts_url(query=query)
-    response_status, response_data = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -2952,7 +2965,7 @@ def test_get_hosts_fields_param(query, fields, mocker, graphql_query_empty_respo
 def test_get_hosts_by_ids(num_hosts, mocker, filtering_datetime_mock, graphql_query_empty_response, api_get):
     host_id_list = [generate_uuid() for h in range(num_hosts)]
     url = build_hosts_url(query=f"/{','.join(host_id_list)}")
-    response_status, _ = api_get(url)
+    response_status, _ = api_get(url, return_response_as_json=False)
 
     assert response_status == 200
 
@@ -3087,7 +3100,7 @@ def test_generic_filtering_string(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{op}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
 
                         assert response_status == 200
 
@@ -3133,7 +3146,7 @@ def test_generic_filtering_string_sap_sids(
                 with subtests.test(value=value, query=query, path=path, endpoint="sap_sids"):
                     url = build_system_profile_sap_sids_url(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
 
                     assert response_status == 200
 
@@ -3227,7 +3240,7 @@ def test_generic_filtering_boolean(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{op}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
                         assert response_status == 200
 
                         query_verifier(mocker, query_mock, query)
@@ -3272,7 +3285,7 @@ def test_generic_filtering_boolean_sap_sids(
                 with subtests.test(value=value, query=query, path=path, endpoint="sap_sids"):
                     url = build_system_profile_sap_sids_url(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
 
                     assert response_status == 200
 
@@ -3370,7 +3383,7 @@ def test_generic_filtering_integer_equality(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{op}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
                         assert response_status == 200
 
                         query_verifier(mocker, query_mock, query)
@@ -3414,7 +3427,7 @@ def test_generic_filtering_integer_range(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{api_operation}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
                         assert response_status == 200
 
                         query_verifier(mocker, query_mock, query)
@@ -3456,7 +3469,7 @@ def test_generic_filtering_timestamp_equality(
                 with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                     url = url_builder(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
                     assert response_status == 200
 
                     query_verifier(mocker, query_mock, query)
@@ -3494,7 +3507,7 @@ def test_generic_filtering_timestamp_range(
             with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                 url = url_builder(query=f"?filter{path}{api_operation}={value}")
 
-                response_status, _ = api_get(url)
+                response_status, _ = api_get(url, return_response_as_json=False)
                 assert response_status == 200
 
                 query_verifier(mocker, query_mock, query)
@@ -3539,7 +3552,7 @@ def test_generic_filtering_integer_sap_sids(
                 with subtests.test(value=value, query=query, path=path, endpoint="sap_sids"):
                     url = build_system_profile_sap_sids_url(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
 
                     assert response_status == 200
 
@@ -3647,7 +3660,7 @@ def test_generic_filtering_wildcard(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{op}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
 
                         assert response_status == 200
 
@@ -3676,7 +3689,7 @@ def test_generic_filtering_wildcard_sap_sids(
                 with subtests.test(value=value, query=query, path=path, endpoint="sap_sids"):
                     url = build_system_profile_sap_sids_url(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
 
                     assert response_status == 200
 
@@ -3706,7 +3719,7 @@ def test_generic_filtering_wildcard_invalid_values(subtests, patch_xjoin_post, a
     for url_builder in endpoint_url_builders:
         for prefix in prefixes:
             for suffix in suffixes:
-                with subtests.test(url_builder=url_builder, prefix=prefix, suffix=suffix):
+                with subtests.test(url_builder=url_builder.__name__, prefix=prefix, suffix=suffix):
                     url = url_builder(query=prefix + suffix)
                     response_status, response_data = api_get(url)
 
@@ -3767,7 +3780,7 @@ def test_generic_filtering_objects(
                     with subtests.test(value=value, query=query, path=path, endpoint=endpoint):
                         url = url_builder(query=f"?filter{path}{op}={value}")
 
-                        response_status, _ = api_get(url)
+                        response_status, _ = api_get(url, return_response_as_json=False)
 
                         assert response_status == 200
 
@@ -3810,7 +3823,7 @@ def test_generic_filtering_objects_sap_sids(
                 with subtests.test(value=value, query=query, path=path, endpoint="sap_sids"):
                     url = build_system_profile_sap_sids_url(query=f"?filter{path}{op}={value}")
 
-                    response_status, _ = api_get(url)
+                    response_status, _ = api_get(url, return_response_as_json=False)
 
                     assert response_status == 200
 
@@ -94,7 +94,7 @@ echo '===================================='
 echo '====        Running Tests       ===='
 echo '===================================='
 set +e
-docker exec $TEST_CONTAINER_ID /bin/bash -c 'python manage.py db upgrade && pytest --cov=. --junitxml=junit-unittest.xml --cov-report html -sv'
+docker exec $TEST_CONTAINER_ID /bin/bash -c 'python manage.py db upgrade && pytest -n auto --cov=. --junitxml=junit-unittest.xml --cov-report html -v'
 TEST_RESULT=$?
 set -e
 